@@ -1,33 +1,55 @@
 import os
 from slack_bolt.async_app import AsyncApp
 from slack_bolt.adapter.socket_mode.async_handler import AsyncSocketModeHandler
-from slack_sdk.web.async_client import AsyncWebClient
 from dotenv import load_dotenv
+from app.utils.gateway import GatewayWebClient, current_lane, LANE_INTERACTIVE, LANE_BACKGROUND
+from app.utils.http import http_pool, HTTP_TIMEOUT
 
 # Load environment variables
 load_dotenv()
 
 def create_app():
     """Create and configure the Slack bot application."""
-    # Initialize the app with bot token
-    app = AsyncApp(token=os.environ.get("SLACK_BOT_TOKEN"))
-    
-    # Create client and store it in app's context
-    client = AsyncWebClient(token=os.environ.get("SLACK_BOT_TOKEN"))
+    # Initialize the app with a client whose calls pass through the rate limit gateway.
+    # Bolt's per-request clients and Socket Mode reuse its pooled HTTP session.
+    client = GatewayWebClient(
+        token=os.environ.get("SLACK_BOT_TOKEN"),
+        session=http_pool.session(),
+        timeout=HTTP_TIMEOUT
+    )
+    # The signing secret verifies HTTP mode requests; Socket Mode does not need it
+    app = AsyncApp(client=client, signing_secret=os.environ.get("SLACK_SIGNING_SECRET"))
     app._client = client  # Store client in private attribute
+
+    @app.middleware
+    async def route_through_gateway(context, body, next):
+        """Give listeners a gateway client; event traffic goes in the background lane."""
+        context["client"] = GatewayWebClient.wrap(context.client)
+        # Each request is dispatched in its own task, so the lane stays with this request
+        current_lane.set(LANE_BACKGROUND if body.get("type") == "event_callback" else LANE_INTERACTIVE)
+        await next()
     
     # Register handlers
     from app.handlers.status import register_status_handlers
     from app.handlers.reminders import register_reminder_handlers
     from app.handlers.commands import register_command_handlers
+    from app.handlers.events import register_event_handlers
     
     register_status_handlers(app)
     register_reminder_handlers(app)
     register_command_handlers(app)
+    register_event_handlers(app)
     
     return app
 
 async def start_app(app):
     """Start the bot in socket mode."""
+    from app.handlers.reminders import sent_reminders
+
     handler = AsyncSocketModeHandler(app, os.environ.get("APP_LEVEL_TOKEN"))
-    await handler.start_async() 
\ No newline at end of file
+    try:
+        await handler.start_async()
+    finally:
+        # Keep reminders sent since the last flush from going out again after a restart
+        await sent_reminders.flush()
+        await http_pool.close() 
\ No newline at end of file
@@ -14,20 +14,25 @@ logging.basicConfig(
 # Bot configuration
 BOT_TOKEN = os.environ.get("SLACK_BOT_TOKEN")
 APP_LEVEL_TOKEN = os.environ.get("APP_LEVEL_TOKEN")
+SIGNING_SECRET = os.environ.get("SLACK_SIGNING_SECRET")
 DEVELOPER_USERGROUP_ID = os.environ.get("DEVELOPER_USERGROUP_ID")
 FALLBACK_DEVELOPER_IDS = os.environ.get("FALLBACK_DEVELOPER_IDS", "").split(",")
 TEST_CHANNEL = os.environ.get("TEST_CHANNEL", "#test_channel")
 
 # Server configuration
 PORT = int(os.environ.get("PORT", 3000))
+SLACK_MODE = os.environ.get("SLACK_MODE", "socket")  # "socket" or "http" (Events API behind ASGI workers)
+WEB_WORKERS = int(os.environ.get("WEB_WORKERS", os.cpu_count() or 1))  # Worker processes in HTTP mode
 
 # Validate required environment variables
 def validate_config():
     """Validate that all required environment variables are set."""
-    required_vars = {
-        "SLACK_BOT_TOKEN": BOT_TOKEN,
-        "APP_LEVEL_TOKEN": APP_LEVEL_TOKEN
-    }
+    required_vars = {"SLACK_BOT_TOKEN": BOT_TOKEN}
+    if SLACK_MODE == "http":
+        # Bolt rejects HTTP requests whose signature does not match this secret
+        required_vars["SLACK_SIGNING_SECRET"] = SIGNING_SECRET
+    else:
+        required_vars["APP_LEVEL_TOKEN"] = APP_LEVEL_TOKEN
     
     missing_vars = [var for var, value in required_vars.items() if not value]
     
@@ -69,5 +74,22 @@ PRIORITIES = {
     "low": "🟢"
 }
 
+# Status message layout; the renderer compiles these into templates once at import
+STATUS_MESSAGE = {
+    "divider": "━" * 40,
+    "header": "📊 *Status Update from <@{user_id}>*",
+    "edited": " (edited)",
+    "local_time": "🕒 *Local Time:* {local_time} ({user_tz})",
+    "priority": "🎯 *Priority:* {priority_emoji} {priority}",
+    "update": "📝 *Update:*",
+    "next_steps": "⏭️ *Next Steps:*",
+    "dev_notes": "🤓 *Dev Notes:*",
+    "blockers": "🚫 *Blockers:*",
+    "no_blocker_details": "No details provided",
+    "media": "📎 *Attached Media:*",
+    "edit_button": "✏️ Edit Update",
+    "time_format": "%I:%M %p"
+}
+
 # Initialize configuration
 validate_config() 
\ No newline at end of file
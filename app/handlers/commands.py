@@ -1,6 +1,12 @@
 import logging
 from app.utils.developers import is_developer, get_developer_user_ids
-from app.handlers.reminders import send_initial_prompt
+from app.utils.form import build_status_modal
+from app.handlers.reminders import wave_reports
+from app.utils.jobs import job_queue
+from app.utils.gateway import slack_gateway
+from app.utils.http import http_pool
+from app.utils.retry import slack_breaker
+from app.utils.prefetch import prefetch_user_flow
 
 logger = logging.getLogger(__name__)
 
@@ -38,13 +44,51 @@ def register_command_handlers(app):
             )
             return
         
-        # Send the initial prompt to start the status update flow
-        await send_initial_prompt(client, user_id)
+        # Open the form straight away; the channel is picked inside the modal
+        try:
+            await client.views_open(
+                trigger_id=body["trigger_id"],
+                view=build_status_modal()
+            )
+        except Exception as e:
+            logger.error(f"Error opening status modal for {user_id}: {e}")
+            await client.chat_postEphemeral(
+                channel=user_id,
+                user=user_id,
+                text="😅 Sorry, there was an error opening the status form. Please try again."
+            )
+            return
+
+        # The channel search and submission will need these next
+        prefetch_user_flow(client, user_id)
 
     @app.message("health_check")
     async def handle_health_check(message, say):
         """Handle the health check message."""
-        await say("🤖 Bot is up and running! All systems go! 🚀")
+        metrics = job_queue.metrics()
+        gateway = slack_gateway.metrics()
+        pool = http_pool.stats()
+        open_circuits = slack_breaker.open_circuits()
+        if wave_reports:
+            wave = wave_reports[-1]
+            last_wave = (
+                f"{wave['cohort']}, {wave['sent']}/{wave['size']} sent, {wave['failed']} failed, "
+                f"spread over {wave['spread_seconds']}s "
+                f"({'within' if wave['within_window'] else 'over'} its window)"
+            )
+        else:
+            last_wave = "none yet"
+        await say(
+            "🤖 Bot is up and running! All systems go! 🚀\n"
+            f"Job queue: {metrics['depth']}/{metrics['capacity']} queued, "
+            f"{metrics['completed']} done, {metrics['failed']} failed\n"
+            f"Slack API: {gateway['in_flight']}/{gateway['capacity']} in flight, "
+            f"{gateway['interactive']['waiting']} interactive and {gateway['background']['waiting']} background waiting\n"
+            f"HTTP pool: {pool['in_flight']}/{pool['size']} in use (peak {pool['max_in_flight']}), "
+            f"{pool['connections_reused']} reused and {pool['connections_created']} new connections\n"
+            f"Open circuits: {', '.join(open_circuits) if open_circuits else 'none'}\n"
+            f"Last reminder wave: {last_wave}"
+        )
 
     @app.event("url_verification")
     async def handle_verification(body, ack):
@@ -0,0 +1,90 @@
+import os
+import logging
+from app.utils.directory import user_directory
+from app.utils.timezone import get_user_timezone
+from app.utils.developers import (
+    get_developer_user_ids,
+    apply_developer_changes,
+    set_developer_user_ids
+)
+from app.utils.channels import channel_catalog
+from app.handlers.reminders import reschedule_user, unschedule_user
+
+logger = logging.getLogger(__name__)
+
+def register_event_handlers(app):
+    """Register handlers that keep the in-memory user, developer and channel indexes current."""
+
+    @app.event("user_change")
+    async def handle_user_change(event, client, logger):
+        """Update a user's timezone and move their reminder if it changed."""
+        user = event["user"]
+        previous_tz = user_directory.get_timezone(user["id"])
+        user_directory.update_user(user)
+        new_tz = user_directory.get_timezone(user["id"])
+        # A worker whose directory has not loaded this user yet still forwards the change;
+        # rescheduling a reminder in an unchanged timezone leaves it where it was
+        if new_tz and new_tz != previous_tz:
+            logger.info(f"Timezone for {user['id']} changed from {previous_tz or 'unknown'} to {new_tz}")
+            if user["id"] in await get_developer_user_ids(client):
+                await reschedule_user(app, user["id"], new_tz)
+
+    @app.event("subteam_members_changed")
+    async def handle_subteam_members_changed(event, client, logger):
+        """Apply developer usergroup membership changes."""
+        if event.get("subteam_id") != os.environ.get("DEVELOPER_USERGROUP_ID"):
+            return
+        added = event.get("added_users", [])
+        removed = event.get("removed_users", [])
+        apply_developer_changes(added, removed)
+        for user_id in removed:
+            await unschedule_user(app, user_id)
+        for user_id in added:
+            # Users missing from the directory are looked up rather than assumed to be on UTC
+            user_tz = await get_user_timezone(client, user_id)
+            await reschedule_user(app, user_id, user_tz)
+
+    @app.event("subteam_updated")
+    async def handle_subteam_updated(event, logger):
+        """Replace the developer list when the usergroup is updated."""
+        subteam = event.get("subteam", {})
+        if subteam.get("id") != os.environ.get("DEVELOPER_USERGROUP_ID"):
+            return
+        if "users" in subteam:
+            set_developer_user_ids(subteam["users"])
+
+    @app.event("channel_created")
+    async def handle_channel_created(event, logger):
+        """Add a new channel to the project channel list."""
+        channel_catalog.upsert(event["channel"])
+
+    @app.event("channel_rename")
+    async def handle_channel_rename(event, logger):
+        """Rename a channel in the project channel list."""
+        channel_catalog.upsert(event["channel"])
+
+    @app.event("channel_archive")
+    async def handle_channel_archive(event, logger):
+        """Drop an archived channel from the project channel list."""
+        channel_catalog.remove(event["channel"])
+
+    @app.event("member_joined_channel")
+    async def handle_member_joined_channel(event, context, client, logger):
+        """Mark channels the bot has joined, picking up newly visible private ones."""
+        if event.get("user") != context.get("bot_user_id"):
+            return
+        if event["channel"] in channel_catalog:
+            channel_catalog.set_membership(event["channel"], True)
+            return
+        try:
+            response = await client.conversations_info(channel=event["channel"])
+            if response["ok"]:
+                channel_catalog.upsert({**response["channel"], "is_member": True})
+        except Exception as e:
+            logger.error(f"Error fetching joined channel {event['channel']}: {e}")
+
+    @app.event("member_left_channel")
+    async def handle_member_left_channel(event, context, logger):
+        """Mark channels the bot has been removed from."""
+        if event.get("user") == context.get("bot_user_id"):
+            channel_catalog.set_membership(event["channel"], False)
@@ -1,141 +1,483 @@
 import os
+import heapq
 import logging
 import asyncio
-import aioschedule
-from datetime import datetime, date
+from collections import defaultdict, deque
+from datetime import datetime, date, timedelta
 import pytz
-from app.utils.timezone import get_user_timezone, get_user_local_time
-from app.utils.developers import get_developer_user_ids
-from app.utils.developers import retry_with_backoff
+from app.utils.timezone import get_user_timezone, get_user_local_time, get_next_reminder_time
+from app.utils.developers import get_developer_user_ids, apply_developer_changes
+from app.utils.directory import user_directory
+from app.utils.retry import retry_with_backoff, RetryPolicy
+from app.utils.ledger import ReminderLedger, ScheduledReminders, ScheduleChanges
+from app.utils.pacing import AdaptivePacer
+from app.utils.prefetch import prefetch_user_flow
+from app.utils.gateway import current_lane, LANE_BACKGROUND
+from slack_sdk.errors import SlackApiError
 
 logger = logging.getLogger(__name__)
 
-# Track sent reminders to avoid duplicates
-sent_reminders = set()  # Set of (user_id, date) tuples
+REMINDER_HOUR = 17  # Local hour at which developers are prompted
+REMINDER_GRACE_PERIOD = timedelta(hours=1)  # Still send reminders this late if the loop lagged
+SCHEDULER_REFRESH_INTERVAL = timedelta(hours=6)  # Consistency check; events reschedule in between
+DEVELOPER_RETRY_INTERVAL = timedelta(minutes=5)  # Wait before retrying a failed developer lookup
+SCHEDULE_CHANGE_POLL = timedelta(seconds=5)  # How often the scheduler process picks up forwarded changes
 
-def get_reminder_key(user_id: str) -> tuple:
-    """Get the key for tracking reminders for a user."""
-    return (user_id, date.today().isoformat())
+# "post" sends prompts from the scheduler loop; "schedule" hands them to
+# chat.scheduleMessage ahead of time so Slack delivers them
+REMINDER_DELIVERY = os.environ.get("REMINDER_DELIVERY", "post").lower()
+PLANNER_INTERVAL = timedelta(hours=6)  # Well under a day, so a delivered reminder is always followed by the next
+SCHEDULE_MIN_LEAD = timedelta(minutes=2)  # Slack rejects post_at values too close to now
 
-async def send_initial_prompt(client, user_id):
+# Smoothing spreads each cohort's reminders across a window instead of bursting
+REMINDER_SMOOTHING = os.environ.get("REMINDER_SMOOTHING", "false").lower() == "true"
+REMINDER_WAVE_WINDOW = timedelta(seconds=int(os.environ.get("REMINDER_WAVE_WINDOW", 300)))
+
+# Send rate shared by all waves, tuned by the rate limits Slack reports
+wave_pacer = AdaptivePacer()
+
+# Completion reports for recent reminder waves
+wave_reports = deque(maxlen=50)
+
+# Track sent reminders to avoid duplicates, persisted across restarts
+sent_reminders = ReminderLedger()  # Holds (user_id, local_date) tuples
+
+# Reminders handed to chat.scheduleMessage, one pending entry per user
+scheduled_reminders = ScheduledReminders()
+
+# Changes from worker processes that do not run the scheduler
+schedule_changes = ScheduleChanges()
+
+def get_reminder_key(user_id: str, local_date: date = None) -> tuple:
+    """Get the key for tracking reminders for a user on their local date."""
+    return (user_id, (local_date or date.today()).isoformat())
+
+def build_initial_prompt() -> dict:
+    """Build the text and blocks of the daily status update prompt."""
+    return {
+        "text": "Do you have any end-of-day status updates to share today?",
+        "blocks": [
+            {
+                "type": "section",
+                "text": {"type": "mrkdwn", "text": "📊 *Time for your daily status update!*\nDo you have any updates to share today?"},
+                "accessory": {
+                    "type": "static_select",
+                    "placeholder": {"type": "plain_text", "text": "Select an option"},
+                    "options": [
+                        {"text": {"type": "plain_text", "text": "Yes, let's do it! ✨"}, "value": "yes_update"},
+                        {"text": {"type": "plain_text", "text": "Not today 🙅‍♂️"}, "value": "no_update"}
+                    ],
+                    "action_id": "initial_update_choice"
+                }
+            }
+        ]
+    }
+
+async def send_initial_prompt(client, user_id, local_date: date = None):
     """Send the initial status update prompt to a user."""
     try:
         # Use retry_with_backoff for rate limit handling
         await retry_with_backoff(
             client.chat_postMessage,
             channel=user_id,
-            text="Do you have any end-of-day status updates to share today?",
-            blocks=[
-                {
-                    "type": "section",
-                    "text": {"type": "mrkdwn", "text": "📊 *Time for your daily status update!*\nDo you have any updates to share today?"},
-                    "accessory": {
-                        "type": "static_select",
-                        "placeholder": {"type": "plain_text", "text": "Select an option"},
-                        "options": [
-                            {"text": {"type": "plain_text", "text": "Yes, let's do it! ✨"}, "value": "yes_update"},
-                            {"text": {"type": "plain_text", "text": "Not today 🙅‍♂️"}, "value": "no_update"}
-                        ],
-                        "action_id": "initial_update_choice"
-                    }
-                }
-            ]
+            **build_initial_prompt()
         )
         # Mark reminder as sent
-        sent_reminders.add(get_reminder_key(user_id))
+        sent_reminders.add(get_reminder_key(user_id, local_date))
         logger.info(f"Sent reminder to user {user_id}")
+        prefetch_user_flow(client, user_id)
     except Exception as e:
         logger.error(f"Error sending initial prompt to {user_id}: {e}")
 
-def is_5pm_in_timezone(user_tz: str) -> bool:
-    """Check if it's 5 PM in the user's timezone."""
+async def send_paced_prompt(client, user_id, local_date: date, max_retries: int = 3) -> bool:
+    """Send the initial prompt, feeding the outcome back into the wave pacer."""
+    policy = RetryPolicy(attempts=max_retries, on_ratelimit=wave_pacer.on_ratelimit)
     try:
-        current_time = get_user_local_time(user_tz)
-        is_5pm = current_time.hour == 17 and current_time.minute == 0
-        logger.debug(f"Time check for {user_tz}: {current_time.strftime('%I:%M %p')} - Is 5 PM? {is_5pm}")
-        return is_5pm
+        await policy.call(client.chat_postMessage, channel=user_id, **build_initial_prompt())
     except Exception as e:
-        logger.error(f"Error checking time for timezone {user_tz}: {e}")
+        logger.error(f"Error sending initial prompt to {user_id}: {e}")
         return False
+    sent_reminders.add(get_reminder_key(user_id, local_date))
+    wave_pacer.on_success()
+    logger.info(f"Sent reminder to user {user_id}")
+    prefetch_user_flow(client, user_id)
+    return True
 
-async def send_daily_reminders(app):
-    """Send reminders to all developers at 5 PM in their local timezone."""
+async def send_reminder_wave(client, cohort: str, reminders: list, window: timedelta = REMINDER_WAVE_WINDOW):
+    """Spread one cohort's reminders across `window`, paced to the observed rate-limit headroom."""
+    loop = asyncio.get_running_loop()
+    started_at = datetime.now(pytz.UTC)
+    deadline = loop.time() + window.total_seconds()
+    pending = [(user_id, local_date) for user_id, local_date in reminders
+               if get_reminder_key(user_id, local_date) not in sent_reminders]
+    sent = failed = 0
+
+    for index, (user_id, local_date) in enumerate(pending):
+        if await send_paced_prompt(client, user_id, local_date):
+            sent += 1
+        else:
+            failed += 1
+        remaining = len(pending) - index - 1
+        if remaining:
+            await asyncio.sleep(wave_pacer.next_interval(remaining, deadline - loop.time()))
+
+    finished_at = datetime.now(pytz.UTC)
+    report = {
+        "cohort": cohort,
+        "size": len(pending),
+        "sent": sent,
+        "failed": failed,
+        "started_at": started_at.isoformat(),
+        "finished_at": finished_at.isoformat(),
+        "spread_seconds": round((finished_at - started_at).total_seconds(), 1),
+        "within_window": finished_at - started_at <= window
+    }
+    wave_reports.append(report)
+    logger.info(
+        f"Reminder wave {cohort}: {sent}/{len(pending)} sent, {failed} failed, "
+        f"spread over {report['spread_seconds']}s (window {window.total_seconds():.0f}s)"
+    )
+    if not report["within_window"]:
+        logger.warning(f"Reminder wave {cohort} overran its window")
+    return report
+
+async def send_daily_reminders(client, reminders):
+    """Send reminders for a list of (user_id, local_date) pairs that are due."""
     try:
-        # Get all developer user IDs (now using cache)
-        developer_ids = await get_developer_user_ids(app._client)
-        if not developer_ids:
-            logger.warning("No developers found to send reminders to")
-            return
-            
-        # Process developers in batches to avoid rate limits
-        batch_size = 5
-        tasks = []
-        reminders_sent = 0
-        
-        for i in range(0, len(developer_ids), batch_size):
-            batch = developer_ids[i:i + batch_size]
-            batch_tasks = []
-            
-            for user_id in batch:
-                # Skip if reminder already sent today
-                if get_reminder_key(user_id) in sent_reminders:
-                    continue
-                
-                try:
-                    # Get user's timezone
-                    user_tz = await get_user_timezone(app._client, user_id)
-                    current_time = get_user_local_time(user_tz)
-                    
-                    # Check if it's 5 PM in their timezone
-                    if is_5pm_in_timezone(user_tz):
-                        logger.info(f"🕔 Sending reminder to user {user_id} in {user_tz}")
-                        batch_tasks.append(send_initial_prompt(app._client, user_id))
-                        reminders_sent += 1
-                
-                except Exception as e:
-                    logger.error(f"Error processing reminder for user {user_id}: {e}")
-                    continue
-            
-            # Wait for batch to complete before processing next batch
-            if batch_tasks:
-                await asyncio.gather(*batch_tasks)
-                await asyncio.sleep(1)  # Small delay between batches
-        
-        # Only log if we actually sent any reminders
-        if reminders_sent > 0:
-            logger.info(f"Sent {reminders_sent} reminders in this check")
+        # Skip users whose reminder was already sent for their local day
+        due = [
+            (user_id, local_date) for user_id, local_date in reminders
+            if get_reminder_key(user_id, local_date) not in sent_reminders
+        ]
+
+        # The Slack gateway paces the sends to the chat.postMessage limits
+        if due:
+            await asyncio.gather(*(send_initial_prompt(client, user_id, local_date) for user_id, local_date in due))
+            logger.info(f"Sent {len(due)} reminders in this wave")
                 
     except Exception as e:
         logger.error(f"Error in send_daily_reminders: {e}")
 
 async def cleanup_old_reminders():
-    """Clean up old reminder records."""
-    today = date.today().isoformat()
-    sent_reminders.clear()  # Clear all old records
-    logger.info("Cleaned up old reminder records")
+    """Clean up reminder records older than the ledger's retention period."""
+    pruned = sent_reminders.prune()
+    if pruned:
+        logger.info(f"Cleaned up {pruned} old reminder records")
 
-async def start_reminder_scheduler(app):
-    """Start the reminder scheduler."""
-    logger.info("Starting reminder scheduler...")
-    
-    # Schedule cleanup at midnight UTC
-    aioschedule.every().day.at("00:00").do(cleanup_old_reminders)
-    
-    # Schedule the reminder check to run every minute
-    aioschedule.every(1).minutes.do(send_daily_reminders, app)
-    
+class ReminderScheduler:
+    """
+    Keep each developer's next local reminder time in a priority queue and
+    sleep until the earliest one is due, instead of polling every minute.
+    """
+
+    def __init__(self, client, hour=REMINDER_HOUR, grace_period=REMINDER_GRACE_PERIOD,
+                 refresh_interval=SCHEDULER_REFRESH_INTERVAL):
+        self.client = client
+        self.hour = hour
+        self.grace_period = grace_period
+        self.refresh_interval = refresh_interval
+        self._queue = []  # Heap of (due_utc, user_id, user_tz)
+        self._scheduled = {}  # user_id -> (due_utc, user_tz); heap entries not matching are stale
+        self._next_refresh = None
+        self._wakeup = asyncio.Event()
+        self._waves = set()  # Smoothed reminder waves still sending
+
+    def _push(self, user_id: str, user_tz: str, due: datetime):
+        self._scheduled[user_id] = (due, user_tz)
+        heapq.heappush(self._queue, (due, user_id, user_tz))
+        self._wakeup.set()
+
+    def schedule(self, user_id: str, user_tz: str, now: datetime = None):
+        """(Re)schedule a developer's next reminder, including one missed within the grace period."""
+        now = now or datetime.now(pytz.UTC)
+        due = get_next_reminder_time(user_tz, self.hour, now - self.grace_period)
+        self._push(user_id, user_tz, due)
+        logger.debug(f"Next reminder for {user_id} ({user_tz}) at {due.isoformat()}")
+
+    def unschedule(self, user_id: str):
+        """Drop a developer from the schedule; their heap entries become stale."""
+        self._scheduled.pop(user_id, None)
+
+    async def refresh(self):
+        """Sync the schedule with the current developer list and their timezones."""
+        now = datetime.now(pytz.UTC)
+        self._next_refresh = now + self.refresh_interval
+        await cleanup_old_reminders()
+
+        try:
+            developer_ids = await get_developer_user_ids(self.client, strict=True)
+        except Exception as e:
+            # Keep the current schedule rather than unscheduling everyone
+            logger.error(f"Could not fetch developers, keeping the current schedule: {e}")
+            self._next_refresh = now + DEVELOPER_RETRY_INTERVAL
+            return
+        if not developer_ids:
+            logger.warning("No developers found to schedule reminders for")
+
+        for user_id in set(self._scheduled) - set(developer_ids):
+            self.unschedule(user_id)
+
+        for user_id in developer_ids:
+            user_tz = await get_user_timezone(self.client, user_id)
+            scheduled = self._scheduled.get(user_id)
+            if scheduled and scheduled[1] == user_tz:
+                continue
+            self.schedule(user_id, user_tz, now)
+
+        logger.info(f"Reminder schedule holds {len(self._scheduled)} developers")
+
+    def _pop_due(self, now: datetime) -> list:
+        due = []
+        while self._queue and self._queue[0][0] <= now:
+            due_at, user_id, user_tz = heapq.heappop(self._queue)
+            if self._scheduled.get(user_id) != (due_at, user_tz):
+                continue
+            due.append((due_at, user_id, user_tz))
+        return due
+
+    async def _dispatch(self, entries: list, now: datetime):
+        cohorts = defaultdict(list)
+        for due_at, user_id, user_tz in entries:
+            # Queue tomorrow's reminder before sending today's
+            self._push(user_id, user_tz, get_next_reminder_time(user_tz, self.hour, due_at))
+            if now - due_at > self.grace_period:
+                logger.warning(f"Skipping reminder for {user_id}: {now - due_at} past due")
+                continue
+            local_date = due_at.astimezone(pytz.timezone(user_tz)).date()
+            logger.info(f"🕔 Sending reminder to user {user_id} in {user_tz}")
+            cohorts[due_at].append((user_id, local_date))
+
+        for due_at, reminders in cohorts.items():
+            if REMINDER_SMOOTHING:
+                cohort = due_at.strftime("%Y-%m-%dT%H:%MZ")
+                wave = asyncio.create_task(send_reminder_wave(self.client, cohort, reminders))
+                self._waves.add(wave)
+                wave.add_done_callback(self._waves.discard)
+            else:
+                await send_daily_reminders(self.client, reminders)
+
+    async def _sleep_until(self, deadline: datetime):
+        self._wakeup.clear()
+        timeout = max((deadline - datetime.now(pytz.UTC)).total_seconds(), 0)
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def run(self):
+        """Run the scheduler loop forever."""
+        while True:
+            try:
+                now = datetime.now(pytz.UTC)
+                if self._next_refresh is None or now >= self._next_refresh:
+                    await self.refresh()
+
+                due = self._pop_due(now)
+                if due:
+                    await self._dispatch(due, now)
+                    continue
+
+                deadline = self._next_refresh
+                if self._queue and self._queue[0][0] < deadline:
+                    deadline = self._queue[0][0]
+                await self._sleep_until(deadline)
+            except Exception as e:
+                logger.error(f"Error in scheduler loop: {e}")
+                await asyncio.sleep(1)  # Still sleep to prevent tight loop on error
+
+class ReminderPlanner:
+    """
+    Every few hours, hand each developer's next local reminder to
+    chat.scheduleMessage so Slack delivers it without the bot staying awake.
+    Passes are idempotent: a pending reminder is left alone unless the
+    developer's timezone changed.
+    """
+
+    def __init__(self, client, hour=REMINDER_HOUR, plan_interval=PLANNER_INTERVAL):
+        self.client = client
+        self.hour = hour
+        self.plan_interval = plan_interval
+
+    async def _dm_channel(self, user_id: str) -> str:
+        scheduled = scheduled_reminders.get(user_id)
+        if scheduled:
+            return scheduled["channel_id"]
+        response = await retry_with_backoff(self.client.conversations_open, users=user_id)
+        return response["channel"]["id"]
+
+    async def cancel(self, user_id: str):
+        """Delete a user's pending scheduled reminder, if any."""
+        scheduled = scheduled_reminders.get(user_id)
+        if not scheduled or not scheduled["scheduled_message_id"]:
+            return
+        if scheduled["post_at"] > datetime.now(pytz.UTC).timestamp():
+            try:
+                await retry_with_backoff(
+                    self.client.chat_deleteScheduledMessage,
+                    channel=scheduled["channel_id"],
+                    scheduled_message_id=scheduled["scheduled_message_id"]
+                )
+                logger.info(f"Cancelled scheduled reminder for {user_id}")
+            except SlackApiError as e:
+                # Already delivered or deleted
+                logger.warning(f"Could not cancel scheduled reminder for {user_id}: {e}")
+        scheduled["scheduled_message_id"] = None
+        await scheduled_reminders.save(scheduled)
+
+    async def plan_user(self, user_id: str, user_tz: str, now: datetime = None):
+        """Make sure the user's next reminder is scheduled for their local reminder hour."""
+        now = now or datetime.now(pytz.UTC)
+        post_at = get_next_reminder_time(user_tz, self.hour, now + SCHEDULE_MIN_LEAD)
+        local_date = post_at.astimezone(pytz.timezone(user_tz)).date()
+
+        scheduled = scheduled_reminders.get(user_id)
+        if scheduled and scheduled["scheduled_message_id"] and scheduled["post_at"] > now.timestamp():
+            if scheduled["user_tz"] == user_tz:
+                # Still pending; post_at above may already be the following day's slot
+                return
+            # Timezone changed since it was planned
+            await self.cancel(user_id)
+
+        if get_reminder_key(user_id, local_date) in sent_reminders:
+            return
+
+        try:
+            channel_id = await self._dm_channel(user_id)
+            response = await retry_with_backoff(
+                self.client.chat_scheduleMessage,
+                channel=channel_id,
+                post_at=int(post_at.timestamp()),
+                **build_initial_prompt()
+            )
+            await scheduled_reminders.save({
+                "user_id": user_id,
+                "channel_id": channel_id,
+                "scheduled_message_id": response["scheduled_message_id"],
+                "post_at": int(post_at.timestamp()),
+                "user_tz": user_tz,
+                "local_date": local_date.isoformat()
+            })
+            logger.info(f"Scheduled reminder for {user_id} at {post_at.isoformat()} ({user_tz})")
+        except Exception as e:
+            logger.error(f"Error scheduling reminder for {user_id}: {e}")
+
+    async def reschedule(self, user_id: str):
+        """Re-plan a user's reminder, e.g. after their timezone changed."""
+        user_tz = await get_user_timezone(self.client, user_id)
+        await self.plan_user(user_id, user_tz)
+
+    async def plan(self):
+        """Run one planning pass over all developers."""
+        now = datetime.now(pytz.UTC)
+        await cleanup_old_reminders()
+        # Raises if the lookup failed, so scheduled reminders are not cancelled
+        developer_ids = await get_developer_user_ids(self.client, strict=True)
+        if not developer_ids:
+            logger.warning("No developers found to schedule reminders for")
+
+        for user_id in set(scheduled_reminders) - set(developer_ids):
+            await self.cancel(user_id)
+            await scheduled_reminders.remove(user_id)
+
+        for user_id in developer_ids:
+            user_tz = await get_user_timezone(self.client, user_id)
+            await self.plan_user(user_id, user_tz, now)
+        logger.info(f"Planned reminders for {len(developer_ids)} developers")
+
+    async def run(self):
+        """Plan reminders now and then once per interval."""
+        while True:
+            try:
+                await self.plan()
+                delay = self.plan_interval
+            except Exception as e:
+                logger.error(f"Error in reminder planner: {e}")
+                delay = DEVELOPER_RETRY_INTERVAL
+            await asyncio.sleep(delay.total_seconds())
+
+def runs_schedule(app) -> bool:
+    """Whether this process runs the reminder scheduler or planner."""
+    return getattr(app, "_reminder_scheduler", None) is not None or getattr(app, "_reminder_planner", None) is not None
+
+async def reschedule_user(app, user_id: str, user_tz: str):
+    """Move a developer's next reminder to their (new) timezone."""
+    if not runs_schedule(app):
+        # Another worker process owns the schedule
+        await schedule_changes.push(user_id, user_tz)
+        return
+    scheduler = getattr(app, "_reminder_scheduler", None)
+    if scheduler is not None:
+        scheduler.schedule(user_id, user_tz)
+    planner = getattr(app, "_reminder_planner", None)
+    if planner is not None:
+        await planner.plan_user(user_id, user_tz)
+
+async def unschedule_user(app, user_id: str):
+    """Stop reminding a user who is no longer a developer."""
+    if not runs_schedule(app):
+        await schedule_changes.push(user_id)
+        return
+    scheduler = getattr(app, "_reminder_scheduler", None)
+    if scheduler is not None:
+        scheduler.unschedule(user_id)
+    planner = getattr(app, "_reminder_planner", None)
+    if planner is not None:
+        await planner.cancel(user_id)
+        await scheduled_reminders.remove(user_id)
+
+async def apply_schedule_changes(app) -> int:
+    """Apply changes forwarded by other worker processes; returns how many there were."""
+    changes = await schedule_changes.take()
+    for user_id, user_tz in changes:
+        # Bring this process's lists in line first, so the next refresh does not undo the change
+        if user_tz is None:
+            apply_developer_changes(removed=[user_id])
+            await unschedule_user(app, user_id)
+        else:
+            user_directory.update_user({"id": user_id, "tz": user_tz})
+            apply_developer_changes(added=[user_id])
+            await reschedule_user(app, user_id, user_tz)
+    if changes:
+        logger.info(f"Applied {len(changes)} forwarded reminder schedule changes")
+    return len(changes)
+
+async def poll_schedule_changes(app):
+    """Apply forwarded schedule changes as they arrive."""
     while True:
         try:
-            # Run pending jobs and await their completion
-            for job in aioschedule.jobs:
-                if job.should_run:
-                    task = job.job_func()
-                    if asyncio.iscoroutine(task):
-                        await task
-            await asyncio.sleep(1)
+            await apply_schedule_changes(app)
         except Exception as e:
-            logger.error(f"Error in scheduler loop: {e}")
-            await asyncio.sleep(1)  # Still sleep to prevent tight loop on error
+            logger.error(f"Error applying forwarded schedule changes: {e}")
+        await asyncio.sleep(SCHEDULE_CHANGE_POLL.total_seconds())
+
+async def start_reminder_scheduler(app, poll_changes: bool = False):
+    """
+    Start the reminder scheduler.
+
+    With `poll_changes`, as in HTTP mode where other workers forward schedule
+    changes, keep applying them as they arrive; otherwise this process sees
+    every event itself and only applies changes queued before it started.
+    """
+    logger.info("Starting reminder scheduler...")
+    # Reminder traffic yields to interactive Slack calls
+    current_lane.set(LANE_BACKGROUND)
+    await sent_reminders.open()
+    if REMINDER_DELIVERY == "schedule":
+        await scheduled_reminders.open()
+        app._reminder_planner = ReminderPlanner(app._client)
+        run = app._reminder_planner.run()
+    else:
+        app._reminder_scheduler = ReminderScheduler(app._client)
+        run = app._reminder_scheduler.run()
+
+    if poll_changes:
+        await asyncio.gather(run, poll_schedule_changes(app))
+        return
+    try:
+        await apply_schedule_changes(app)
+    except Exception as e:
+        logger.error(f"Error applying forwarded schedule changes: {e}")
+    await run
 
 def register_reminder_handlers(app):
     """Register all reminder-related handlers."""
@@ -148,7 +490,7 @@ def register_reminder_handlers(app):
         
         try:
             # Get all developer user IDs
-            developer_ids = await get_developer_user_ids()
+            developer_ids = await get_developer_user_ids(client)
             if not developer_ids:
                 await client.chat_postMessage(
                     channel=body["user_id"],
@@ -171,10 +513,10 @@ def register_reminder_handlers(app):
             # Force trigger reminders for all developers
             for user_id in developer_ids:
                 try:
-                    user_tz = await get_user_timezone(user_id)
+                    user_tz = await get_user_timezone(client, user_id)
                     current_time = get_user_local_time(user_tz)
                     logger.info(f"Testing reminder for user {user_id} in timezone {user_tz} (current time: {current_time})")
-                    await send_initial_prompt(client, user_id)
+                    await send_initial_prompt(client, user_id, current_time.date())
                 except Exception as e:
                     logger.error(f"Error sending test reminder to user {user_id}: {e}")
                     await client.chat_postMessage(
@@ -1,11 +1,93 @@
+import re
 import json
+import asyncio
 import logging
-from app.utils.form import get_form_data, build_status_modal
+from app.config import MESSAGES
+from app.utils.form import (
+    get_form_data, get_batch_form_data, get_selected_channel, build_status_modal, rebuild_status_modal
+)
 from app.utils.timezone import get_user_timezone, get_user_local_time
-from app.utils.developers import get_relevant_project_channels
+from app.utils.channels import channel_catalog
+from app.utils.files import resolve_files
+from app.utils.render import render_status, content_hash
+from app.utils.store import status_store
+from app.utils.jobs import job_queue
+from app.utils.retry import is_retryable
+from app.utils.idempotency import submission_guard, view_submission_key
+from app.utils.prefetch import prefetch_user_flow
+from app.utils.sessions import conversation_sessions
 
 logger = logging.getLogger(__name__)
 
+def has_project_channels(client) -> bool:
+    """Start loading the channel catalog; only an empty, fully loaded catalog has nothing to pick."""
+    # The picker searches as the user types, so it can open before the first sweep finishes
+    channel_catalog.warm(client)
+    return not channel_catalog.is_loaded or len(channel_catalog) > 0
+
+def build_channel_picker_blocks(prompt: str) -> list:
+    """Build a channel picker whose options are searched server-side as the user types."""
+    return [
+        {
+            "type": "section",
+            "text": {"type": "mrkdwn", "text": prompt},
+            "accessory": {
+                "type": "external_select",
+                "placeholder": {"type": "plain_text", "text": "Choose a channel 📝"},
+                "min_query_length": 0,
+                "action_id": "select_project_channel"
+            }
+        }
+    ]
+
+def build_another_update_blocks(channel_ids: list) -> list:
+    """Build the prompt asking for another update once updates are posted."""
+    channels = ", ".join(f"<#{channel_id}>" for channel_id in channel_ids)
+    posted = f"Your update for {channels} is posted!" if len(channel_ids) == 1 else f"Your updates for {channels} are posted!"
+    return [
+        {
+            "type": "section",
+            "text": {"type": "mrkdwn", "text": f"✅ {posted}\n🔄 *Want to update another project?*"},
+            "accessory": {
+                "type": "static_select",
+                "placeholder": {"type": "plain_text", "text": "Make your choice ✨"},
+                "options": [
+                    {"text": {"type": "plain_text", "text": "Yes, one more! 🚀"}, "value": "yes_another"},
+                    {"text": {"type": "plain_text", "text": "That's all! 🎉"}, "value": "no_another"}
+                ],
+                "action_id": "another_update_choice"
+            }
+        }
+    ]
+
+async def queue_submission(name: str, func, body: dict, view: dict, client, error_text: str):
+    """
+    Queue `func(body, view, client)` to process an acked view submission.
+
+    Slack may redeliver a submission after a slow ack or a reconnect, so each
+    one is claimed first and replays are dropped. If the job still fails after
+    its retry, the claim is released and the user is told with `error_text`.
+    """
+    user_id = body["user"]["id"]
+    submission_key = view_submission_key(view)
+    if not await submission_guard.claim(submission_key):
+        logger.info(f"Ignoring replayed {name} {submission_key} from user {user_id}")
+        return
+
+    async def report_error(e):
+        await submission_guard.release(submission_key)
+        logger.error(f"Error in {name} job: {e}")
+        logger.error(f"View state: {json.dumps(view['state']['values'], indent=2)}")
+        try:
+            await client.chat_postEphemeral(channel=user_id, user=user_id, text=error_text)
+        except Exception as e2:
+            logger.error(f"Error sending error message: {e2}")
+
+    await job_queue.submit(
+        name, func, body, view, client,
+        retries=1, on_failure=report_error, retry_if=is_retryable
+    )
+
 def register_status_handlers(app):
     """Register all status update related handlers."""
     
@@ -17,40 +99,23 @@ def register_status_handlers(app):
             user_id = body["user"]["id"]
             choice = body["actions"][0]["selected_option"]["value"]
             logger.info(f"Initial choice from user {user_id}: {choice}")
+            conversation_sessions.from_action(body)
 
             if choice == "yes_update":
-                project_channels = await get_relevant_project_channels(client)
-                if project_channels:
-                    channel_options = [
-                        {"text": {"type": "plain_text", "text": channel["name"]}, "value": channel["id"]} 
-                        for channel in project_channels
-                    ]
-                    await client.chat_postMessage(
-                        channel=user_id,
+                # Reminders delivered by chat.scheduleMessage were not prefetched when sent
+                prefetch_user_flow(client, user_id)
+                if has_project_channels(client):
+                    await conversation_sessions.show(
+                        client, user_id,
                         text="Which project channel would you like to update?",
-                        blocks=[
-                            {
-                                "type": "section",
-                                "text": {"type": "mrkdwn", "text": "🎯 *Select the project channel you want to update:*"},
-                                "accessory": {
-                                    "type": "static_select",
-                                    "placeholder": {"type": "plain_text", "text": "Choose a channel 📝"},
-                                    "options": channel_options,
-                                    "action_id": "select_project_channel"
-                                }
-                            }
-                        ]
+                        blocks=build_channel_picker_blocks("🎯 *Select the project channel you want to update:*")
                     )
                 else:
-                    await client.chat_postMessage(
-                        channel=user_id,
-                        text="😕 It seems there are no project channels available to update right now."
-                    )
+                    await conversation_sessions.show(client, user_id, text=MESSAGES["no_channels"])
+                    conversation_sessions.end(user_id)
             elif choice == "no_update":
-                await client.chat_postMessage(
-                    channel=user_id,
-                    text="👋 No worries! Have a productive day! 💪"
-                )
+                await conversation_sessions.show(client, user_id, text="👋 No worries! Have a productive day! 💪")
+                conversation_sessions.end(user_id)
         except Exception as e:
             logger.error(f"Error in initial choice handler: {e}")
             logger.error(f"Request body: {json.dumps(body, indent=2)}")
@@ -63,6 +128,19 @@ def register_status_handlers(app):
             except Exception as e2:
                 logger.error(f"Error sending error message: {e2}")
 
+    @app.options(re.compile("^select_project_channels?$"))
+    async def handle_channel_options(ack, body, client, logger):
+        """Suggest project channels matching what the user has typed."""
+        query = body.get("value", "")
+        # Slack drops options not acked within 3 seconds, so answer from what is loaded
+        # and let a cold or stale catalog fill in from its sweep in the background
+        channel_catalog.warm(client)
+        options = [
+            {"text": {"type": "plain_text", "text": channel["name"][:75]}, "value": channel["id"]}
+            for channel in channel_catalog.search(query)
+        ]
+        await ack(options=options)
+
     @app.action("select_project_channel")
     async def handle_project_selection(ack, body, client, logger):
         """Handle project channel selection."""
@@ -71,6 +149,7 @@ def register_status_handlers(app):
             user_id = body["user"]["id"]
             channel_id = body["actions"][0]["selected_option"]["value"]
             logger.info(f"Project selection from user {user_id}: channel {channel_id}")
+            conversation_sessions.from_action(body)
             
             # Build and open the status modal
             modal = build_status_modal(channel_id)
@@ -92,170 +171,147 @@ def register_status_handlers(app):
 
     @app.view("status_submission")
     async def handle_status_submission(ack, body, view, client, logger):
-        """Handle new status submission."""
+        """Handle new status submission; the update is posted by a queued job."""
+        await ack()
+        await queue_submission(
+            "status_submission", post_status_update, body, view, client,
+            error_text="😅 Oops! Something went wrong while posting your update. Please try again!"
+        )
+
+    async def post_status_update(body, view, client):
+        """Post a submitted status update to its channel."""
+        channel_id = get_selected_channel(view)
+        user_id = body["user"]["id"]
+        logger.info(f"Status submission from user {user_id} for channel {channel_id}")
+
+        # Get form data
+        form_data = get_form_data(view["state"]["values"])
+
+        # Get user's timezone
+        user_tz = await get_user_timezone(client, user_id)
+        current_time = get_user_local_time(user_tz)
+
+        # Attached media
+        media_files = []
+        if "media_block" in view["state"]["values"]:
+            media_files = view["state"]["values"]["media_block"]["media_upload"]["files"] or []
+
+        await publish_status_update(client, user_id, channel_id, form_data, media_files, user_tz, current_time)
+
+        # The update is posted; later failures must not make the job retry and post it twice
         try:
-            await ack()
-            metadata = json.loads(view["private_metadata"])
-            channel_id = metadata["channel_id"]
-            user_id = body["user"]["id"]
-            logger.info(f"Status submission from user {user_id} for channel {channel_id}")
-            
-            # Get form data
-            form_data = get_form_data(view["state"]["values"])
-            
-            # Get user's timezone
-            user_tz = await get_user_timezone(client, user_id)
-            current_time = get_user_local_time(user_tz)
-            
-            # Build the message
-            priority_emoji = {
-                "high": "🔴",
-                "medium": "🟡",
-                "low": "🟢"
-            }.get(form_data["priority"], "🟡")
-
-            message = (
-                f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-                f"📊 *Status Update from <@{user_id}>*\n"
-                f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-                f"🕒 *Local Time:* {current_time.strftime('%I:%M %p')} ({user_tz})\n"
-                f"🎯 *Priority:* {priority_emoji} {form_data['priority'].upper()}\n\n"
-                f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-                f"📝 *Update:*\n{form_data['update_text']}\n\n"
-                f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-                f"⏭️ *Next Steps:*\n{form_data['next_steps']}\n"
+            # Ask about another update in the message the flow is shown in
+            await conversation_sessions.show(
+                client, user_id,
+                text="Do you have another project you'd like to provide an update for?",
+                blocks=build_another_update_blocks([channel_id])
             )
+        except Exception as e:
+            logger.error(f"Error asking {user_id} about another update: {e}")
 
-            if form_data.get("technical_details"):
-                message += f"\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-                message += f"🤓 *Dev Notes:*\n{form_data['technical_details']}\n"
-
-            if form_data.get("blockers") == "yes":
-                message += f"\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-                message += f"🚫 *Blockers:*\n{form_data.get('blockers_details', 'No details provided')}\n"
-
-            # Handle media files
-            media_blocks = []
-            if "media_block" in view["state"]["values"]:
-                media_files = view["state"]["values"]["media_block"]["media_upload"]["files"]
-                if media_files:
-                    message += "\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-                    message += "📎 *Attached Media:*\n"
-                    
-                    for file in media_files:
-                        file_id = file["id"]
-                        file_info = await client.files_info(file=file_id)
-                        if file_info["ok"]:
-                            file_data = file_info["file"]
-                            file_url = file_data["url_private"]
-                            file_name = file_data["name"]
-                            file_type = file_data["filetype"]
-                            
-                            # Add file to message
-                            message += f"• {file_name}\n"
-                            
-                            # Add file block if it's an image
-                            if file_type in ["png", "jpg", "jpeg", "gif"]:
-                                media_blocks.append({
-                                    "type": "image",
-                                    "image_url": file_url,
-                                    "alt_text": file_name
-                                })
-                            else:
-                                # For non-image files, add a link
-                                media_blocks.append({
-                                    "type": "section",
-                                    "text": {
-                                        "type": "mrkdwn",
-                                        "text": f"📄 <{file_url}|{file_name}>"
-                                    }
-                                })
-
-            # Post the message with media blocks
-            blocks = [
-                {
-                    "type": "section",
-                    "text": {"type": "mrkdwn", "text": message}
-                }
-            ]
-            
-            # Add media blocks if any
-            blocks.extend(media_blocks)
-            
-            # Add edit button
-            blocks.append({
-                "type": "actions",
-                "elements": [
-                    {
-                        "type": "button",
-                        "text": {"type": "plain_text", "text": "✏️ Edit Update", "emoji": True},
-                        "style": "primary",
-                        "action_id": "edit_status_update",
-                        "value": json.dumps({
-                            "channel_id": channel_id,
-                            "form_data": form_data,
-                            "message_ts": None,
-                            "media_files": [f["id"] for f in media_files] if "media_block" in view["state"]["values"] else []
-                        })
-                    }
-                ]
-            })
-
-            # Post the message
-            response = await client.chat_postMessage(
-                channel=channel_id,
-                text=message,
-                blocks=blocks
-            )
+    async def publish_status_update(client, user_id, channel_id, form_data, media_files, user_tz, current_time):
+        """Render and post one status update, and store it for the edit flow."""
+        resolved_files = await resolve_files(client, media_files)
 
-            # Update the button with message timestamp
+        # Render the message with an edit button carrying only the update ID
+        update_id = status_store.new_update_id()
+        message, blocks = render_status(user_id, form_data, current_time, user_tz, resolved_files, update_id)
+
+        # Post the message
+        response = await client.chat_postMessage(
+            channel=channel_id,
+            text=message,
+            blocks=blocks
+        )
+
+        # Store everything the edit flow needs
+        try:
             if response["ok"]:
-                message_ts = response["ts"]
-                blocks[-1]["elements"][0]["value"] = json.dumps({
+                await status_store.save({
+                    "update_id": update_id,
+                    "user_id": user_id,
                     "channel_id": channel_id,
+                    "message_ts": response["ts"],
                     "form_data": form_data,
-                    "message_ts": message_ts,
-                    "media_files": [f["id"] for f in media_files] if "media_block" in view["state"]["values"] else []
+                    "media_files": [f["id"] for f in media_files],
+                    "media": resolved_files,
+                    "content_hash": content_hash(form_data, [f["id"] for f in resolved_files])
                 })
-                
-                await client.chat_update(
-                    channel=channel_id,
-                    ts=message_ts,
-                    text=message,
-                    blocks=blocks
-                )
+        except Exception as e:
+            logger.error(f"Error storing status update {update_id}: {e}")
+        return update_id
 
-            # Ask about another update
-            await client.chat_postMessage(
-                channel=user_id,
-                text="Do you have another project you'd like to provide an update for?",
-                blocks=[
-                    {
-                        "type": "section",
-                        "text": {"type": "mrkdwn", "text": "🔄 *Want to update another project?*"},
-                        "accessory": {
-                            "type": "static_select",
-                            "placeholder": {"type": "plain_text", "text": "Make your choice ✨"},
-                            "options": [
-                                {"text": {"type": "plain_text", "text": "Yes, one more! 🚀"}, "value": "yes_another"},
-                                {"text": {"type": "plain_text", "text": "That's all! 🎉"}, "value": "no_another"}
-                            ],
-                            "action_id": "another_update_choice"
-                        }
-                    }
-                ]
+    @app.action("select_project_channels")
+    async def handle_project_channels_change(ack, body, client, logger):
+        """Switch the modal between single and batch layouts as channels are picked."""
+        await ack()
+        view = body["view"]
+        selected = body["actions"][0]["selected_options"]
+        if len(selected) <= 1 and view["callback_id"] != "status_submission_batch":
+            return  # The single layout already fits
+        try:
+            await client.views_update(
+                view_id=view["id"],
+                hash=view["hash"],
+                view=rebuild_status_modal(view, selected)
             )
         except Exception as e:
-            logger.error(f"Error in status submission handler: {e}")
-            logger.error(f"View state: {json.dumps(view['state']['values'], indent=2)}")
-            try:
+            logger.error(f"Error switching status modal layout: {e}")
+
+    @app.view("status_submission_batch")
+    async def handle_batch_submission(ack, body, view, client, logger):
+        """Handle a batch submission; the updates are posted by a queued job."""
+        await ack()
+        await queue_submission(
+            "status_submission_batch", post_batch_updates, body, view, client,
+            error_text="😅 Oops! Something went wrong while posting your updates. Please try again!"
+        )
+
+    async def post_batch_updates(body, view, client):
+        """Post every update of a batch submission concurrently."""
+        user_id = body["user"]["id"]
+        updates = get_batch_form_data(view)
+        logger.info(f"Batch submission from user {user_id} for {len(updates)} channels")
+
+        # Get user's timezone once for all updates
+        user_tz = await get_user_timezone(client, user_id)
+        current_time = get_user_local_time(user_tz)
+
+        # Posts to different channels proceed together under the Slack gateway's limits
+        results = await asyncio.gather(
+            *(publish_status_update(client, user_id, channel_id, form_data, [], user_tz, current_time)
+              for channel_id, form_data in updates),
+            return_exceptions=True
+        )
+        posted = []
+        failed = []
+        for (channel_id, _), result in zip(updates, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error posting batch update for channel {channel_id}: {result}")
+                failed.append(channel_id)
+            else:
+                posted.append(channel_id)
+
+        # Nothing was posted, so the whole job can safely be retried
+        if not posted:
+            raise results[0]
+
+        # Some updates are posted; report the rest instead of retrying them all
+        try:
+            if failed:
                 await client.chat_postEphemeral(
                     channel=user_id,
                     user=user_id,
-                    text="😅 Oops! Something went wrong while posting your update. Please try again!"
+                    text="😅 Sorry, your updates for " + ", ".join(f"<#{channel_id}>" for channel_id in failed)
+                         + " could not be posted. Please try those again!"
                 )
-            except Exception as e2:
-                logger.error(f"Error sending error message: {e2}")
+            await conversation_sessions.show(
+                client, user_id,
+                text="Do you have another project you'd like to provide an update for?",
+                blocks=build_another_update_blocks(posted)
+            )
+        except Exception as e:
+            logger.error(f"Error asking {user_id} about another update: {e}")
 
     @app.action("edit_status_update")
     async def handle_edit_status(ack, body, client, logger):
@@ -263,11 +319,26 @@ def register_status_handlers(app):
         try:
             await ack()
             user_id = body["user"]["id"]
-            value_data = json.loads(body["actions"][0]["value"])
+            value = body["actions"][0]["value"]
+            if value.startswith("{"):
+                # Updates posted before the status store carried everything in the button
+                value_data = json.loads(value)
+                update_id = None
+            else:
+                update_id = value
+                value_data = await status_store.get(update_id)
+                if value_data is None:
+                    logger.error(f"Unknown status update {update_id} in edit button")
+                    await client.chat_postEphemeral(
+                        channel=body["channel"]["id"],
+                        user=user_id,
+                        text="😅 Sorry, there was an error opening the edit form. This update could not be found."
+                    )
+                    return
             channel_id = value_data["channel_id"]
-            form_data = value_data["form_data"]
+            form_data = dict(value_data["form_data"])
             message_ts = value_data.get("message_ts")
-            media_files = value_data.get("media_files", [])  # Get media files from the button value
+            media_files = value_data.get("media_files", [])  # Get media files from the stored update
             
             if not message_ts:
                 logger.error("Missing message timestamp in edit button value")
@@ -281,9 +352,10 @@ def register_status_handlers(app):
             logger.info(f"Edit status triggered by user {user_id} for message {message_ts}")
             logger.info(f"Media files to preserve: {media_files}")
             
-            # Add message_ts and media_files to form_data
+            # Add message_ts, media_files and update_id to form_data
             form_data["message_ts"] = message_ts
             form_data["media_files"] = media_files  # Add media files to form data
+            form_data["update_id"] = update_id
             
             # Build and open the edit modal
             modal = build_status_modal(channel_id, form_data)
@@ -305,201 +377,101 @@ def register_status_handlers(app):
 
     @app.view("status_submission_edit")
     async def handle_status_edit_submission(ack, body, view, client, logger):
-        """Handle edited status submission."""
-        try:
-            await ack()
-            metadata = json.loads(view["private_metadata"])
-            channel_id = metadata["channel_id"]
-            message_ts = metadata.get("message_ts")
-            user_id = body["user"]["id"]
-            existing_media_files = metadata.get("media_files", [])
-            
-            logger.info(f"Edit submission - Existing media files: {existing_media_files}")
-            
-            if not message_ts:
-                logger.error("Missing message timestamp in edit submission")
-                await client.chat_postEphemeral(
-                    channel=channel_id,
-                    user=user_id,
-                    text="😅 Sorry, there was an error updating your status. The message timestamp is missing."
-                )
-                return
-                
-            logger.info(f"Edit submission from user {user_id} for message {message_ts}")
-            
-            # Get form data
-            form_data = get_form_data(view["state"]["values"])
-            
-            # Get user's timezone
-            user_tz = await get_user_timezone(client, user_id)
-            current_time = get_user_local_time(user_tz)
-            
-            # Build the message
-            priority_emoji = {
-                "high": "🔴",
-                "medium": "🟡",
-                "low": "🟢"
-            }.get(form_data["priority"], "🟡")
-
-            message = (
-                f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-                f"📊 *Status Update from <@{user_id}>* (edited)\n"
-                f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n\n"
-                f"🕒 *Local Time:* {current_time.strftime('%I:%M %p')} ({user_tz})\n"
-                f"🎯 *Priority:* {priority_emoji} {form_data['priority'].upper()}\n\n"
-                f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-                f"📝 *Update:*\n{form_data['update_text']}\n\n"
-                f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-                f"⏭️ *Next Steps:*\n{form_data['next_steps']}\n"
-            )
-
-            if form_data.get("technical_details"):
-                message += f"\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-                message += f"🤓 *Dev Notes:*\n{form_data['technical_details']}\n"
+        """Handle edited status submission; the message is updated by a queued job."""
+        await ack()
+        await queue_submission(
+            "status_submission_edit", update_status_message, body, view, client,
+            error_text="😅 Sorry, there was an error updating your status. Please try again."
+        )
 
-            if form_data.get("blockers") == "yes":
-                message += f"\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-                message += f"🚫 *Blockers:*\n{form_data.get('blockers_details', 'No details provided')}\n"
+    async def update_status_message(body, view, client):
+        """Apply an edited status update to its message."""
+        metadata = json.loads(view["private_metadata"])
+        channel_id = metadata["channel_id"]
+        message_ts = metadata.get("message_ts")
+        update_id = metadata.get("update_id")
+        user_id = body["user"]["id"]
+        existing_media_files = metadata.get("media_files", [])
 
-            # Handle media files
-            media_blocks = []
-            media_files = []
+        logger.info(f"Edit submission - Existing media files: {existing_media_files}")
 
-            # First, handle existing media files that weren't removed
-            if "media_block" in view["state"]["values"]:
-                current_files = view["state"]["values"]["media_block"]["media_upload"]["files"]
-                current_file_ids = [f["id"] for f in current_files]
-                
-                # Keep only the existing files that are still present
-                for file_id in existing_media_files:
-                    if file_id in current_file_ids:
-                        try:
-                            file_info = await client.files_info(file=file_id)
-                            if file_info["ok"]:
-                                file_data = file_info["file"]
-                                file_url = file_data["url_private"]
-                                file_name = file_data["name"]
-                                file_type = file_data["filetype"]
-                                
-                                # Add file to message
-                                message += f"• {file_name}\n"
-                                
-                                # Add file block if it's an image
-                                if file_type in ["png", "jpg", "jpeg", "gif"]:
-                                    media_blocks.append({
-                                        "type": "image",
-                                        "image_url": file_url,
-                                        "alt_text": file_name
-                                    })
-                                else:
-                                    # For non-image files, add a link
-                                    media_blocks.append({
-                                        "type": "section",
-                                        "text": {
-                                            "type": "mrkdwn",
-                                            "text": f"📄 <{file_url}|{file_name}>"
-                                        }
-                                    })
-                                media_files.append({"id": file_id})
-                        except Exception as e:
-                            logger.error(f"Error processing existing file {file_id}: {e}")
-
-            # Then, handle new media files
-            if "media_block" in view["state"]["values"]:
-                new_files = view["state"]["values"]["media_block"]["media_upload"]["files"]
-                if new_files:
-                    for file in new_files:
-                        file_id = file["id"]
-                        if file_id not in existing_media_files:  # Only process new files
-                            try:
-                                file_info = await client.files_info(file=file_id)
-                                if file_info["ok"]:
-                                    file_data = file_info["file"]
-                                    file_url = file_data["url_private"]
-                                    file_name = file_data["name"]
-                                    file_type = file_data["filetype"]
-                                    
-                                    # Add file to message
-                                    message += f"• {file_name}\n"
-                                    
-                                    # Add file block if it's an image
-                                    if file_type in ["png", "jpg", "jpeg", "gif"]:
-                                        media_blocks.append({
-                                            "type": "image",
-                                            "image_url": file_url,
-                                            "alt_text": file_name
-                                        })
-                                    else:
-                                        # For non-image files, add a link
-                                        media_blocks.append({
-                                            "type": "section",
-                                            "text": {
-                                                "type": "mrkdwn",
-                                                "text": f"📄 <{file_url}|{file_name}>"
-                                            }
-                                        })
-                                    media_files.append({"id": file_id})
-                            except Exception as e:
-                                logger.error(f"Error processing new file {file_id}: {e}")
-
-            # Build blocks for the message
-            blocks = [
-                {
-                    "type": "section",
-                    "text": {"type": "mrkdwn", "text": message}
-                }
-            ]
-            
-            # Add media blocks if any
-            if media_blocks:
-                message += "\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-                message += "📎 *Attached Media:*\n"
-                blocks.extend(media_blocks)
-            
-            # Add edit button
-            blocks.append({
-                "type": "actions",
-                "elements": [
-                    {
-                        "type": "button",
-                        "text": {"type": "plain_text", "text": "✏️ Edit Update", "emoji": True},
-                        "style": "primary",
-                        "action_id": "edit_status_update",
-                        "value": json.dumps({
-                            "channel_id": channel_id,
-                            "form_data": form_data,
-                            "message_ts": message_ts,
-                            "media_files": [f["id"] for f in media_files]  # Include all media files
-                        })
-                    }
-                ]
-            })
-
-            # Update the message
-            await client.chat_update(
+        if not message_ts:
+            logger.error("Missing message timestamp in edit submission")
+            await client.chat_postEphemeral(
                 channel=channel_id,
-                ts=message_ts,
-                text=message,
-                blocks=blocks
+                user=user_id,
+                text="😅 Sorry, there was an error updating your status. The message timestamp is missing."
             )
+            return
+
+        logger.info(f"Edit submission from user {user_id} for message {message_ts}")
 
-            # Notify the user
+        # Get form data
+        form_data = get_form_data(view["state"]["values"])
+
+        # Handle media files, keeping existing files that weren't removed before new ones
+        current_files = []
+        if "media_block" in view["state"]["values"]:
+            current_files = view["state"]["values"]["media_block"]["media_upload"]["files"] or []
+        current_by_id = {f["id"]: f for f in current_files}
+        ordered_files = [current_by_id[file_id] for file_id in existing_media_files if file_id in current_by_id]
+        ordered_files += [f for f in current_files if f["id"] not in existing_media_files]
+        file_ids = [f["id"] for f in ordered_files]
+
+        # Nothing to do if the edit changes nothing that is shown
+        stored = await status_store.get(update_id) if update_id else None
+        new_hash = content_hash(form_data, file_ids)
+        if stored and stored.get("content_hash") == new_hash:
+            logger.info(f"Edit of status update {update_id} changes nothing, skipping message update")
             await client.chat_postEphemeral(
                 channel=channel_id,
                 user=user_id,
-                text="✅ Your status update has been edited!"
+                text="👌 No changes to your status update."
             )
-        except Exception as e:
-            logger.error(f"Error in edit submission handler: {e}")
-            logger.error(f"View state: {json.dumps(view['state']['values'], indent=2)}")
-            try:
-                await client.chat_postEphemeral(
-                    channel=user_id,
-                    user=user_id,
-                    text="😅 Sorry, there was an error updating your status. Please try again."
-                )
-            except Exception as e2:
-                logger.error(f"Error sending error message: {e2}")
+            return
+
+        # Get user's timezone
+        user_tz = await get_user_timezone(client, user_id)
+        current_time = get_user_local_time(user_tz)
+
+        # Media resolved for the stored update is reused; only new files are resolved
+        stored_media = {f["id"]: f for f in (stored or {}).get("media", [])}
+        if stored and stored["media_files"] == file_ids and all(file_id in stored_media for file_id in file_ids):
+            media_files = [stored_media[file_id] for file_id in file_ids]
+        else:
+            media_files = await resolve_files(client, [stored_media.get(f["id"], f) for f in ordered_files])
+
+        # Updates posted before the status store get an ID now
+        if not update_id:
+            update_id = status_store.new_update_id()
+        message, blocks = render_status(user_id, form_data, current_time, user_tz, media_files, update_id, edited=True)
+
+        # Update the message
+        await client.chat_update(
+            channel=channel_id,
+            ts=message_ts,
+            text=message,
+            blocks=blocks
+        )
+
+        await status_store.save({
+            **(stored or {}),
+            "update_id": update_id,
+            "user_id": user_id,
+            "channel_id": channel_id,
+            "message_ts": message_ts,
+            "form_data": form_data,
+            "media_files": [f["id"] for f in media_files],
+            "media": media_files,
+            "content_hash": content_hash(form_data, [f["id"] for f in media_files])
+        })
+
+        # Notify the user
+        await client.chat_postEphemeral(
+            channel=channel_id,
+            user=user_id,
+            text="✅ Your status update has been edited!"
+        )
 
     @app.action("another_update_choice")
     async def handle_another_update(ack, body, client, logger):
@@ -509,40 +481,27 @@ def register_status_handlers(app):
             user_id = body["user"]["id"]
             choice = body["actions"][0]["selected_option"]["value"]
             logger.info(f"Another update choice from user {user_id}: {choice}")
+            conversation_sessions.from_action(body)
 
             if choice == "yes_another":
-                project_channels = await get_relevant_project_channels(client)
-                if project_channels:
-                    channel_options = [
-                        {"text": {"type": "plain_text", "text": channel["name"]}, "value": channel["id"]} 
-                        for channel in project_channels
-                    ]
-                    await client.chat_postMessage(
-                        channel=user_id,
+                if has_project_channels(client):
+                    await conversation_sessions.show(
+                        client, user_id,
                         text="Which project channel would you like to update?",
-                        blocks=[
-                            {
-                                "type": "section",
-                                "text": {"type": "mrkdwn", "text": "🔄 *Select another project channel to update:*"},
-                                "accessory": {
-                                    "type": "static_select",
-                                    "placeholder": {"type": "plain_text", "text": "Choose a channel 📝"},
-                                    "options": channel_options,
-                                    "action_id": "select_project_channel"
-                                }
-                            }
-                        ]
+                        blocks=build_channel_picker_blocks("🔄 *Select another project channel to update:*")
                     )
                 else:
-                    await client.chat_postMessage(
-                        channel=user_id,
+                    await conversation_sessions.show(
+                        client, user_id,
                         text="😕 It seems there are no more project channels available to update."
                     )
+                    conversation_sessions.end(user_id)
             elif choice == "no_another":
-                await client.chat_postMessage(
-                    channel=user_id,
+                await conversation_sessions.show(
+                    client, user_id,
                     text="🎉 Awesome! Thanks for all your updates! Keep up the great work! 💪"
                 )
+                conversation_sessions.end(user_id)
         except Exception as e:
             logger.error(f"Error in another update choice handler: {e}")
             logger.error(f"Request body: {json.dumps(body, indent=2)}")
@@ -0,0 +1,85 @@
+import os
+import asyncio
+import logging
+from slack_bolt.adapter.asgi.async_handler import AsyncSlackRequestHandler
+from app.bot import create_app
+from app.config import WEB_WORKERS
+from app.handlers.reminders import start_reminder_scheduler, sent_reminders
+from app.utils.channels import channel_catalog
+from app.utils.directory import user_directory
+from app.utils.gateway import slack_gateway
+from app.utils.http import http_pool
+from app.utils.leader import scheduler_lock, SCHEDULER_LOCK_RETRY
+from app.utils.timezone import setup_timezone
+
+logger = logging.getLogger(__name__)
+
+class SlackAsgiApp(AsyncSlackRequestHandler):
+    """
+    ASGI application for HTTP (Events API) mode.
+
+    Each worker process builds its own bolt app at lifespan startup, inside
+    the server's event loop, so its pooled HTTP session belongs to that loop.
+    Bolt verifies every request against SLACK_SIGNING_SECRET, and each
+    worker's gateway keeps to a 1/WEB_WORKERS share of Slack's rate limits.
+    Only the worker holding the scheduler lock sends reminders; the others
+    forward schedule changes to it through SQLite, and take over if it exits.
+    """
+
+    def __init__(self, path: str = "/slack/events"):
+        super().__init__(None, path)
+        self._scheduler_task = None
+
+    async def _run_scheduler_when_elected(self):
+        while not scheduler_lock.acquire():
+            await asyncio.sleep(SCHEDULER_LOCK_RETRY.total_seconds())
+        logger.info(f"Worker {os.getpid()} is running the reminder scheduler")
+        # Other workers keep forwarding schedule changes while this one runs the scheduler
+        await start_reminder_scheduler(self.app, poll_changes=True)
+
+    async def startup(self):
+        """Build this worker's app and join the scheduler election."""
+        setup_timezone()
+        # Every worker sends with the same token, so each keeps to its share of the rate limits
+        slack_gateway.set_processes(WEB_WORKERS)
+        self.app = create_app()
+        # Load project channels and user timezones before the first request asks for them
+        channel_catalog.warm(self.app._client)
+        user_directory.warm(self.app._client)
+        self._scheduler_task = asyncio.create_task(self._run_scheduler_when_elected())
+        logger.info(f"Worker {os.getpid()} is serving Slack requests on {self.path}")
+
+    async def shutdown(self):
+        """Stop the scheduler, write pending reminder records, hand the lock on and close the HTTP pool."""
+        if self._scheduler_task is not None:
+            self._scheduler_task.cancel()
+            try:
+                await self._scheduler_task
+            except asyncio.CancelledError:
+                pass
+        # Record sent reminders before the next scheduler takes over
+        await sent_reminders.flush()
+        scheduler_lock.release()
+        await http_pool.close()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "lifespan":
+            await super().__call__(scope, receive, send)
+            return
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    await self.startup()
+                except Exception as e:
+                    logger.error(f"Error starting worker: {e}")
+                    await send({"type": "lifespan.startup.failed", "message": str(e)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+# ASGI entry point, e.g. `uvicorn app.server:api --workers 4`
+api = SlackAsgiApp()
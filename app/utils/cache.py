@@ -0,0 +1,99 @@
+import time
+import asyncio
+import logging
+from collections import OrderedDict
+from datetime import timedelta
+
+logger = logging.getLogger(__name__)
+
+class AsyncTTLCache:
+    """
+    Async cache with per-entry TTLs and LRU eviction.
+
+    Concurrent misses for the same key share a single fetch, and entries
+    past their TTL but within `stale_ttl` are served immediately while a
+    background fetch refreshes them. Failed fetches are never cached.
+    """
+
+    def __init__(self, ttl: timedelta, max_size: int = 1024, stale_ttl: timedelta = timedelta(0), name: str = "cache"):
+        self.ttl = ttl.total_seconds()
+        self.stale_ttl = stale_ttl.total_seconds()
+        self.max_size = max_size
+        self.name = name
+        self._entries = OrderedDict()  # key -> (value, fresh_until, stale_until)
+        self._inflight = {}  # key -> task fetching the value
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and time.monotonic() < entry[2]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def peek(self, key, default=None):
+        """Get a cached value without fetching, or `default` if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() >= entry[2]:
+            return default
+        return entry[0]
+
+    def set(self, key, value):
+        """Store a value, evicting the least recently used entry if full."""
+        now = time.monotonic()
+        self._entries[key] = (value, now + self.ttl, now + self.ttl + self.stale_ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def replace(self, key, value):
+        """Swap a cached value in place, keeping its expiry; no-op if absent."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries[key] = (value, entry[1], entry[2])
+
+    def invalidate(self, key=None):
+        """Drop one key, or everything when no key is given."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    async def get(self, key, fetch):
+        """Get a value, calling the `fetch` coroutine function on a miss."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, fresh_until, stale_until = entry
+            now = time.monotonic()
+            if now < fresh_until:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return value
+            if now < stale_until:
+                self.hits += 1
+                logger.debug(f"Serving stale {self.name} entry {key!r} while revalidating")
+                self._start_fetch(key, fetch)
+                return value
+
+        self.misses += 1
+        return await asyncio.shield(self._start_fetch(key, fetch))
+
+    def _start_fetch(self, key, fetch) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, fetch))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._fetch_done(key, done))
+        return task
+
+    def _fetch_done(self, key, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Error fetching {self.name} entry {key!r}: {task.exception()}")
+
+    async def _load(self, key, fetch):
+        value = await fetch()
+        self.set(key, value)
+        return value
@@ -0,0 +1,183 @@
+import bisect
+import logging
+import asyncio
+from datetime import datetime, timedelta
+from slack_sdk.web.async_client import AsyncWebClient
+from app.utils.pagination import CursorPaginator
+from app.utils.gateway import run_in_lane, LANE_BACKGROUND
+
+logger = logging.getLogger(__name__)
+
+CATALOG_REFRESH_INTERVAL = timedelta(hours=1)  # Events keep the catalog current in between
+CATALOG_RETRY_INTERVAL = timedelta(minutes=5)  # Wait before retrying a failed sweep
+CONVERSATIONS_LIST_PAGE_SIZE = 200
+MAX_SEARCH_RESULTS = 100  # Slack's limit on options in a select menu
+
+def is_project_channel(channel: dict) -> bool:
+    """Check whether a channel should be offered for status updates."""
+    # Skip channels that start with '#' (archived) or are general
+    if channel.get("is_archived"):
+        return False
+    return not (channel["name"].startswith("#") or channel["name"] == "general")
+
+class ChannelCatalog:
+    """
+    In-memory catalog of project channels, indexed by ID and by name.
+
+    Loaded by walking every conversations.list page, then kept current by
+    channel events and diffed against a periodic full sweep. Bot membership
+    comes from each channel's `is_member` flag in the same sweep, so no
+    per-channel conversations.members calls are needed.
+    """
+
+    def __init__(self, refresh_interval=CATALOG_REFRESH_INTERVAL):
+        self.refresh_interval = refresh_interval
+        self._by_id = {}  # channel_id -> {"id", "name", "is_member"}
+        self._by_name = {}  # name -> same record
+        self._sorted = None  # Channels ordered by name, rebuilt lazily
+        self._names = None  # Lowercased names parallel to _sorted, for prefix search
+        self._expires_at = None
+        self._loaded = False
+        self._lock = asyncio.Lock()
+        self._refresh_task = None
+
+    def __contains__(self, channel_id: str) -> bool:
+        return channel_id in self._by_id
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded
+
+    @property
+    def is_stale(self) -> bool:
+        return self._expires_at is None or datetime.now() >= self._expires_at
+
+    def get(self, channel_id: str) -> dict:
+        """Get a channel by ID, or None."""
+        return self._by_id.get(channel_id)
+
+    def get_by_name(self, name: str) -> dict:
+        """Get a channel by name, or None."""
+        return self._by_name.get(name.lstrip("#"))
+
+    def channels(self) -> list[dict]:
+        """Get all project channels ordered by name."""
+        if self._sorted is None:
+            self._sorted = sorted(self._by_id.values(), key=lambda c: c["name"].lower())
+            self._names = [channel["name"].lower() for channel in self._sorted]
+        return self._sorted
+
+    def search(self, query: str, limit: int = MAX_SEARCH_RESULTS) -> list[dict]:
+        """Find channels whose name starts with the query, then those containing it."""
+        channels = self.channels()
+        query = query.strip().lstrip("#").lower()
+        if not query:
+            return channels[:limit]
+
+        # Prefix matches are a contiguous run of the sorted name index
+        start = bisect.bisect_left(self._names, query)
+        end = bisect.bisect_left(self._names, query + "\uffff", start)
+        results = channels[start:min(end, start + limit)]
+        if len(results) < limit:
+            for index, name in enumerate(self._names):
+                if query in name and not name.startswith(query):
+                    results.append(channels[index])
+                    if len(results) >= limit:
+                        break
+        return results
+
+    def member_channels(self) -> list[dict]:
+        """Get the project channels the bot is a member of, ordered by name."""
+        return [channel for channel in self.channels() if channel["is_member"]]
+
+    def upsert(self, channel: dict):
+        """Add, rename or drop a channel based on its latest Slack object."""
+        if not is_project_channel(channel):
+            self.remove(channel["id"])
+            return
+        existing = self._by_id.get(channel["id"])
+        # Event payloads such as channel_rename omit is_member
+        is_member = channel.get("is_member", existing["is_member"] if existing else False)
+        if existing and existing["name"] == channel["name"] and existing["is_member"] == is_member:
+            return
+        if existing:
+            self._by_name.pop(existing["name"], None)
+        record = {"id": channel["id"], "name": channel["name"], "is_member": is_member}
+        self._by_id[record["id"]] = record
+        self._by_name[record["name"]] = record
+        self._sorted = None
+
+    def set_membership(self, channel_id: str, is_member: bool):
+        """Record that the bot joined or left a channel."""
+        record = self._by_id.get(channel_id)
+        if record and record["is_member"] != is_member:
+            record["is_member"] = is_member
+            self._sorted = None
+
+    def remove(self, channel_id: str):
+        """Drop a channel from the catalog."""
+        record = self._by_id.pop(channel_id, None)
+        if record:
+            self._by_name.pop(record["name"], None)
+            self._sorted = None
+
+    async def refresh(self, client: AsyncWebClient):
+        """Walk every conversations.list page and apply the differences."""
+        seen = set()
+        known = len(self._by_id)
+
+        def apply_page(channels):
+            # Written straight into the catalog, so searches see each page as it lands
+            for channel in channels:
+                if is_project_channel(channel):
+                    self.upsert(channel)
+                    seen.add(channel["id"])
+
+        try:
+            pages = await CursorPaginator(
+                client.conversations_list, "channels",
+                limit=CONVERSATIONS_LIST_PAGE_SIZE,
+                on_page=apply_page,
+                types="public_channel,private_channel",
+                exclude_archived=True
+            ).sweep()
+        except Exception as e:
+            logger.error(f"Error refreshing channel catalog: {e}")
+            self._expires_at = datetime.now() + CATALOG_RETRY_INTERVAL
+            return
+
+        removed = [channel_id for channel_id in self._by_id if channel_id not in seen]
+        for channel_id in removed:
+            self.remove(channel_id)
+        added = len(self._by_id) + len(removed) - known
+        self._expires_at = datetime.now() + self.refresh_interval
+        self._loaded = True
+        logger.info(
+            f"Channel catalog holds {len(self._by_id)} project channels "
+            f"({pages} pages, +{added} -{len(removed)})"
+        )
+
+    async def _refresh_locked(self, client: AsyncWebClient):
+        async with self._lock:
+            if self.is_stale:
+                await self.refresh(client)
+
+    async def ensure_fresh(self, client: AsyncWebClient):
+        """Load the catalog on first use; afterwards refresh stale data in the background."""
+        if not self.is_stale:
+            return
+        if not self.is_loaded:
+            await self._refresh_locked(client)
+        else:
+            self.warm(client)
+
+    def warm(self, client: AsyncWebClient):
+        """Start loading or refreshing a stale catalog in the background without waiting."""
+        if self.is_stale and (self._refresh_task is None or self._refresh_task.done()):
+            self._refresh_task = asyncio.create_task(run_in_lane(LANE_BACKGROUND, self._refresh_locked(client)))
+
+# Shared catalog instance
+channel_catalog = ChannelCatalog()
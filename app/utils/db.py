@@ -0,0 +1,36 @@
+import os
+import asyncio
+import logging
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+DATABASE_PATH = os.environ.get("DATABASE_PATH", "eod_status.db")
+
+# All database work runs on one thread so SQLite access is serialized
+# and never blocks the event loop.
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="eod-db")
+_connections = {}
+
+def get_connection(path: str = None) -> sqlite3.Connection:
+    """Get the shared SQLite connection for a database file."""
+    path = path or DATABASE_PATH
+    conn = _connections.get(path)
+    if conn is None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        _connections[path] = conn
+        logger.info(f"Opened database {path}")
+    return conn
+
+async def run_db(func, *args, path: str = None):
+    """Run func(conn, *args) on the database thread and return its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _executor, lambda: func(get_connection(path), *args)
+    )
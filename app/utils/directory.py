@@ -0,0 +1,108 @@
+import logging
+import asyncio
+from datetime import datetime, timedelta
+from slack_sdk.web.async_client import AsyncWebClient
+from app.utils.pagination import CursorPaginator
+from app.utils.gateway import run_in_lane, LANE_BACKGROUND
+
+logger = logging.getLogger(__name__)
+
+DIRECTORY_REFRESH_INTERVAL = timedelta(hours=6)  # Full users.list sweep cadence
+DIRECTORY_RETRY_INTERVAL = timedelta(minutes=5)  # Wait before retrying a failed sweep
+USERS_LIST_PAGE_SIZE = 200
+
+def _timezone_record(user: dict) -> dict:
+    """Extract the timezone fields we keep from a Slack user object."""
+    return {
+        "tz": user.get("tz") or "UTC",
+        "tz_offset": user.get("tz_offset", 0),
+        "tz_label": user.get("tz_label")
+    }
+
+class UserDirectory:
+    """
+    In-memory timezone directory for every workspace user, loaded in one
+    paginated users.list sweep so timezone lookups never hit the network.
+    """
+
+    def __init__(self, refresh_interval=DIRECTORY_REFRESH_INTERVAL):
+        self.refresh_interval = refresh_interval
+        self._users = {}  # user_id -> {"tz", "tz_offset", "tz_label"}
+        self._expires_at = None
+        self._loaded = False
+        self._lock = asyncio.Lock()
+        self._refresh_task = None
+
+    def __contains__(self, user_id: str) -> bool:
+        return user_id in self._users
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded
+
+    @property
+    def is_stale(self) -> bool:
+        return self._expires_at is None or datetime.now() >= self._expires_at
+
+    def get(self, user_id: str) -> dict:
+        """Get the cached timezone record for a user, or None."""
+        return self._users.get(user_id)
+
+    def get_timezone(self, user_id: str) -> str:
+        """Get the cached timezone name for a user, or None."""
+        record = self._users.get(user_id)
+        return record["tz"] if record else None
+
+    def update_user(self, user: dict):
+        """Add or replace a single user from a Slack user object."""
+        if user.get("deleted"):
+            self._users.pop(user["id"], None)
+            return
+        self._users[user["id"]] = _timezone_record(user)
+
+    async def refresh(self, client: AsyncWebClient):
+        """Reload the directory with a full paginated users.list sweep."""
+        seen = set()
+
+        def apply_page(members):
+            # Written straight into the directory, so lookups see each page as it lands
+            for user in members:
+                if user.get("deleted"):
+                    continue
+                self._users[user["id"]] = _timezone_record(user)
+                seen.add(user["id"])
+
+        try:
+            pages = await CursorPaginator(
+                client.users_list, "members", limit=USERS_LIST_PAGE_SIZE, on_page=apply_page
+            ).sweep()
+        except Exception as e:
+            logger.error(f"Error refreshing user directory: {e}")
+            self._expires_at = datetime.now() + DIRECTORY_RETRY_INTERVAL
+            return
+
+        for user_id in [user_id for user_id in self._users if user_id not in seen]:
+            del self._users[user_id]
+        self._expires_at = datetime.now() + self.refresh_interval
+        self._loaded = True
+        logger.info(f"Loaded timezones for {len(seen)} users from {pages} users.list pages")
+
+    async def _refresh_locked(self, client: AsyncWebClient):
+        async with self._lock:
+            if self.is_stale:
+                await self.refresh(client)
+
+    async def ensure_fresh(self, client: AsyncWebClient):
+        """Start loading or refreshing a stale directory without waiting for the sweep."""
+        self.warm(client)
+
+    def warm(self, client: AsyncWebClient):
+        """Start loading or refreshing a stale directory in the background without waiting."""
+        if self.is_stale and (self._refresh_task is None or self._refresh_task.done()):
+            self._refresh_task = asyncio.create_task(run_in_lane(LANE_BACKGROUND, self._refresh_locked(client)))
+
+# Shared directory instance
+user_directory = UserDirectory()
@@ -0,0 +1,79 @@
+import logging
+import asyncio
+from datetime import timedelta
+from slack_sdk.web.async_client import AsyncWebClient
+from app.utils.cache import AsyncTTLCache
+
+logger = logging.getLogger(__name__)
+
+FILE_FETCH_CONCURRENCY = 4  # Concurrent files.info calls across all submissions
+IMAGE_FILETYPES = ["png", "jpg", "jpeg", "gif"]
+
+# File metadata by file ID
+_file_cache = AsyncTTLCache(timedelta(hours=12), max_size=2048, name="files")
+_fetch_semaphore = asyncio.Semaphore(FILE_FETCH_CONCURRENCY)
+
+def _file_record(file: dict) -> dict:
+    """Keep the fields we render; None if the payload is missing any of them."""
+    if not all(file.get(key) for key in ("name", "filetype", "url_private")):
+        return None
+    return {
+        "id": file["id"],
+        "name": file["name"],
+        "filetype": file["filetype"],
+        "url_private": file["url_private"]
+    }
+
+async def _fetch_file(client: AsyncWebClient, file_id: str) -> dict:
+    async with _fetch_semaphore:
+        file_info = await client.files_info(file=file_id)
+    if not file_info["ok"]:
+        raise RuntimeError(file_info.get("error"))
+    record = _file_record(file_info["file"])
+    if record is None:
+        raise RuntimeError("files.info returned incomplete metadata")
+    return record
+
+async def resolve_files(client: AsyncWebClient, files: list) -> list[dict]:
+    """
+    Resolve metadata for attached files, given as file objects or IDs.
+
+    Metadata already in the payload or in the cache is used as-is; the rest
+    is fetched concurrently. Files that cannot be resolved are skipped.
+    """
+    async def resolve(file):
+        if isinstance(file, str):
+            file_id = file
+        else:
+            file_id = file["id"]
+            record = _file_record(file)
+            if record:
+                _file_cache.set(file_id, record)
+                return record
+        return await _file_cache.get(file_id, lambda: _fetch_file(client, file_id))
+
+    results = await asyncio.gather(*(resolve(file) for file in files), return_exceptions=True)
+    resolved = []
+    for file, result in zip(files, results):
+        if isinstance(result, dict):
+            resolved.append(result)
+        else:
+            logger.error(f"Error resolving file {file if isinstance(file, str) else file['id']}: {result}")
+    return resolved
+
+def build_media_block(file: dict) -> dict:
+    """Build an image block for images, or a link section for other files."""
+    if file["filetype"] in IMAGE_FILETYPES:
+        return {
+            "type": "image",
+            "image_url": file["url_private"],
+            "alt_text": file["name"]
+        }
+    # For non-image files, add a link
+    return {
+        "type": "section",
+        "text": {
+            "type": "mrkdwn",
+            "text": f"📄 <{file['url_private']}|{file['name']}>"
+        }
+    }
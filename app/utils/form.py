@@ -3,39 +3,42 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-def get_form_data(view_state):
+MAX_BATCH_CHANNELS = 8  # Keeps a batch modal within Slack's 100-block limit
+
+def get_form_data(view_state, suffix=""):
     """
     Safely extract form data from the view state, handling empty and optional fields.
+    In a batch modal, suffix selects one channel's fields.
     """
     try:
         # Required fields with safe gets
-        update_text = view_state["update_block"]["update_text"]["value"]
-        next_steps = view_state["next_steps_block"]["next_steps_text"]["value"]
+        update_text = view_state[f"update_block{suffix}"]["update_text"]["value"]
+        next_steps = view_state[f"next_steps_block{suffix}"]["next_steps_text"]["value"]
         
         # Priority with safe fallback
-        priority_block = view_state["priority_block"]["priority_select"]
+        priority_block = view_state[f"priority_block{suffix}"]["priority_select"]
         priority = "medium"  # default
         if priority_block.get("selected_option"):
             priority = priority_block["selected_option"]["value"]
 
         # Optional fields with safe gets
         technical_details = None
-        if "technical_details_block" in view_state:
-            tech_block = view_state["technical_details_block"].get("technical_details_text", {})
+        if f"technical_details_block{suffix}" in view_state:
+            tech_block = view_state[f"technical_details_block{suffix}"].get("technical_details_text", {})
             if tech_block and isinstance(tech_block, dict):
                 technical_details = tech_block.get("value")
 
         blockers = None
-        if "blockers_block" in view_state:
-            blockers_block = view_state["blockers_block"].get("blockers_select", {})
+        if f"blockers_block{suffix}" in view_state:
+            blockers_block = view_state[f"blockers_block{suffix}"].get("blockers_select", {})
             if blockers_block and isinstance(blockers_block, dict):
                 selected_option = blockers_block.get("selected_option")
                 if selected_option and isinstance(selected_option, dict):
                     blockers = selected_option.get("value")
 
         blockers_details = None
-        if "blockers_details_block" in view_state:
-            blockers_details_block = view_state["blockers_details_block"].get("blockers_details_text", {})
+        if f"blockers_details_block{suffix}" in view_state:
+            blockers_details_block = view_state[f"blockers_details_block{suffix}"].get("blockers_details_text", {})
             if blockers_details_block and isinstance(blockers_details_block, dict):
                 blockers_details = blockers_details_block.get("value")
 
@@ -52,10 +55,84 @@ def get_form_data(view_state):
         logger.error(f"View state: {view_state}")
         raise
 
-def build_status_modal(channel_id, form_data=None):
+def get_selected_channel(view):
     """
-    Build the status modal with optional pre-filled data.
-    form_data is only provided when editing an existing status.
+    Get the channel a status modal is for: fixed when the modal was opened,
+    or chosen in its channel picker.
+    """
+    metadata = json.loads(view["private_metadata"])
+    if metadata.get("channel_id"):
+        return metadata["channel_id"]
+    picker = view["state"]["values"]["channel_block"]["select_project_channels"]
+    return picker["selected_options"][0]["value"]
+
+def get_batch_form_data(view):
+    """Extract each channel's form data from a batch modal, as (channel_id, form_data) pairs."""
+    channel_ids = json.loads(view["private_metadata"])["channel_ids"]
+    view_state = view["state"]["values"]
+    return [(channel_id, get_form_data(view_state, f"_{channel_id}")) for channel_id in channel_ids]
+
+def get_draft_form_data(view):
+    """
+    Read what has been typed into a new-update modal so far, as
+    channel_id -> form_data. A single layout's fields are keyed by None.
+    """
+    view_state = view.get("state", {}).get("values", {})
+    if view["callback_id"] == "status_submission_batch":
+        channel_ids = json.loads(view["private_metadata"])["channel_ids"]
+        return {channel_id: _get_draft(view_state, f"_{channel_id}") for channel_id in channel_ids}
+    return {None: _get_draft(view_state, "")}
+
+def _get_draft(view_state, suffix):
+    # Unlike a submission, a half-filled modal may lack any of its values
+    def value(block_id, action_id, key="value"):
+        return (view_state.get(f"{block_id}{suffix}", {}).get(action_id) or {}).get(key)
+
+    def selected(block_id, action_id):
+        option = value(block_id, action_id, "selected_option")
+        return option["value"] if option else None
+
+    return {
+        "update_text": value("update_block", "update_text"),
+        "next_steps": value("next_steps_block", "next_steps_text"),
+        "priority": selected("priority_block", "priority_select") or "medium",
+        "technical_details": value("technical_details_block", "technical_details_text"),
+        "blockers": selected("blockers_block", "blockers_select"),
+        "blockers_details": value("blockers_details_block", "blockers_details_text")
+    }
+
+def has_attached_media(view) -> bool:
+    """Check whether files have been attached in a modal's media input."""
+    media = view.get("state", {}).get("values", {}).get("media_block", {}).get("media_upload", {})
+    return bool(media.get("files"))
+
+def build_channel_picker_input(selected_channels=None):
+    """
+    Build the modal's channel picker. Changing the selection is dispatched to
+    the app so the modal can switch between single and batch layouts.
+    """
+    element = {
+        "type": "multi_external_select",
+        "placeholder": {"type": "plain_text", "text": "Choose channels 📝"},
+        "min_query_length": 0,
+        "max_selected_items": MAX_BATCH_CHANNELS,
+        "action_id": "select_project_channels"
+    }
+    if selected_channels:
+        element["initial_options"] = selected_channels
+    return {
+        "type": "input",
+        "block_id": "channel_block",
+        "dispatch_action": True,
+        "label": {"type": "plain_text", "text": "🎯 Project channels"},
+        "hint": {"type": "plain_text", "text": f"Pick up to {MAX_BATCH_CHANNELS} channels to update them all at once."},
+        "element": element
+    }
+
+def build_update_fields(form_data=None, suffix="", include_media=True):
+    """
+    Build the input blocks for one status update. Block IDs end in suffix so
+    a batch modal can hold one set of fields per channel.
     """
     # Helper function to safely get string values
     def get_string_value(key, default=""):
@@ -65,13 +142,9 @@ def build_status_modal(channel_id, form_data=None):
         return str(value) if value is not None else default
 
     blocks = [
-        {
-            "type": "section",
-            "text": {"type": "mrkdwn", "text": f"Updating status for <#{channel_id}>"}
-        },
         {
             "type": "input",
-            "block_id": "update_block",
+            "block_id": f"update_block{suffix}",
             "label": {"type": "plain_text", "text": "What's your update?"},
             "element": {
                 "type": "plain_text_input",
@@ -103,28 +176,29 @@ def build_status_modal(channel_id, form_data=None):
             })
 
     # Add file upload section
-    blocks.append({
-        "type": "input",
-        "block_id": "media_block",
-        "optional": True,
-        "label": {"type": "plain_text", "text": "📎 Add New Media (optional)"},
-        "element": {
-            "type": "file_input",
-            "action_id": "media_upload",
-            "filetypes": ["png", "jpg", "jpeg", "gif", "pdf"],
-            "max_files": 3
-        },
-        "hint": {
-            "type": "plain_text",
-            "text": "You can upload up to 3 new files (images or PDFs). Max 10MB per file. Existing files will be kept unless removed."
-        }
-    })
+    if include_media:
+        blocks.append({
+            "type": "input",
+            "block_id": "media_block",
+            "optional": True,
+            "label": {"type": "plain_text", "text": "📎 Add New Media (optional)"},
+            "element": {
+                "type": "file_input",
+                "action_id": "media_upload",
+                "filetypes": ["png", "jpg", "jpeg", "gif", "pdf"],
+                "max_files": 3
+            },
+            "hint": {
+                "type": "plain_text",
+                "text": "You can upload up to 3 new files (images or PDFs). Max 10MB per file. Existing files will be kept unless removed."
+            }
+        })
 
     # Add the rest of the blocks
     blocks.extend([
         {
             "type": "input",
-            "block_id": "next_steps_block",
+            "block_id": f"next_steps_block{suffix}",
             "label": {"type": "plain_text", "text": "Next Steps"},
             "element": {
                 "type": "plain_text_input",
@@ -136,7 +210,7 @@ def build_status_modal(channel_id, form_data=None):
         },
         {
             "type": "input",
-            "block_id": "priority_block",
+            "block_id": f"priority_block{suffix}",
             "label": {"type": "plain_text", "text": "Priority"},
             "element": {
                 "type": "static_select",
@@ -155,7 +229,7 @@ def build_status_modal(channel_id, form_data=None):
         },
         {
             "type": "input",
-            "block_id": "technical_details_block",
+            "block_id": f"technical_details_block{suffix}",
             "optional": True,
             "label": {"type": "plain_text", "text": "🤓 Dev Notes (optional)"},
             "element": {
@@ -167,7 +241,7 @@ def build_status_modal(channel_id, form_data=None):
         },
         {
             "type": "input",
-            "block_id": "blockers_block",
+            "block_id": f"blockers_block{suffix}",
             "optional": True,
             "label": {"type": "plain_text", "text": "🚫 Blockers? (optional)"},
             "element": {
@@ -186,7 +260,7 @@ def build_status_modal(channel_id, form_data=None):
         },
         {
             "type": "input",
-            "block_id": "blockers_details_block",
+            "block_id": f"blockers_details_block{suffix}",
             "optional": True,
             "label": {"type": "plain_text", "text": "Blockers Details (optional)"},
             "element": {
@@ -197,6 +271,61 @@ def build_status_modal(channel_id, form_data=None):
             }
         }
     ])
+    return blocks
+
+def build_batch_modal(selected_channels, drafts=None, dropped_media=False):
+    """
+    Build a modal collecting one update per selected channel, given as the
+    picker's selected options. drafts prefills channels' fields by channel ID.
+    Media uploads are left to single updates, which the modal says.
+    """
+    drafts = drafts or {}
+    channel_ids = [option["value"] for option in selected_channels]
+    media_note = "📎 Media can only be attached when updating a single channel."
+    if dropped_media:
+        media_note += " The files you attached were removed; pick one channel to attach them again."
+    blocks = [
+        build_channel_picker_input(selected_channels),
+        {"type": "context", "elements": [{"type": "mrkdwn", "text": media_note}]}
+    ]
+    for channel_id in channel_ids:
+        blocks.append({"type": "divider"})
+        blocks.append({
+            "type": "section",
+            "text": {"type": "mrkdwn", "text": f"📌 *<#{channel_id}>*"}
+        })
+        blocks.extend(build_update_fields(drafts.get(channel_id), suffix=f"_{channel_id}", include_media=False))
+
+    return {
+        "type": "modal",
+        "callback_id": "status_submission_batch",
+        "private_metadata": json.dumps({"channel_ids": channel_ids}),
+        "title": {"type": "plain_text", "text": "Project Status Updates"},
+        "blocks": blocks,
+        "submit": {"type": "plain_text", "text": f"Submit {len(channel_ids)}"}
+    }
+
+def build_status_modal(channel_id=None, form_data=None, selected_channels=None, draft=None):
+    """
+    Build the status modal with optional pre-filled data.
+    form_data is only provided when editing an existing status; draft
+    prefills a new update. Without a channel_id the modal starts with a
+    channel picker, and switches to a batch modal when several channels
+    are selected.
+    """
+    if selected_channels and len(selected_channels) > 1:
+        return build_batch_modal(selected_channels)
+
+    if channel_id:
+        blocks = [
+            {
+                "type": "section",
+                "text": {"type": "mrkdwn", "text": f"Updating status for <#{channel_id}>"}
+            }
+        ]
+    else:
+        blocks = [build_channel_picker_input(selected_channels)]
+    blocks.extend(build_update_fields(form_data or draft))
 
     return {
         "type": "modal",
@@ -204,9 +333,26 @@ def build_status_modal(channel_id, form_data=None):
         "private_metadata": json.dumps({
             "channel_id": channel_id,
             "message_ts": form_data.get("message_ts") if form_data else None,
+            "update_id": form_data.get("update_id") if form_data else None,
             "media_files": form_data.get("media_files", []) if form_data else []
         }),
         "title": {"type": "plain_text", "text": "Edit Status Update" if form_data else "Project Status Update"},
         "blocks": blocks,
         "submit": {"type": "plain_text", "text": "Update" if form_data else "Submit"}
-    } 
\ No newline at end of file
+    }
+
+def rebuild_status_modal(view, selected_channels):
+    """
+    Rebuild a new-update modal after its channel selection changed, keeping
+    what was typed for channels that are still selected.
+    """
+    drafts = get_draft_form_data(view)
+    if None in drafts:
+        # The single layout's fields belong to the channel picked first
+        first = selected_channels[0]["value"] if selected_channels else None
+        drafts = {first: drafts[None]}
+
+    if len(selected_channels) > 1:
+        return build_batch_modal(selected_channels, drafts, dropped_media=has_attached_media(view))
+    first = selected_channels[0]["value"] if selected_channels else None
+    return build_status_modal(selected_channels=selected_channels, draft=drafts.get(first))
@@ -0,0 +1,301 @@
+import os
+import time
+import heapq
+import asyncio
+import logging
+import itertools
+import contextvars
+from slack_sdk.web.async_client import AsyncWebClient
+from app.utils.retry import retry_after, slack_breaker
+
+logger = logging.getLogger(__name__)
+
+# Requests per minute allowed by each of Slack's rate limit tiers
+TIER_RATES = {1: 1, 2: 20, 3: 50, 4: 100}
+DEFAULT_TIER = 3
+METHOD_TIERS = {
+    "users.list": 2,
+    "users.info": 4,
+    "usergroups.users.list": 2,
+    "conversations.list": 2,
+    "conversations.info": 3,
+    "conversations.open": 3,
+    "files.info": 4,
+    "views.open": 4,
+    "views.update": 4,
+    "views.push": 4,
+    "chat.update": 3,
+    "chat.delete": 3,
+    "chat.postEphemeral": 4,
+    "chat.scheduleMessage": 3,
+    "chat.deleteScheduledMessage": 3,
+    "chat.scheduledMessages.list": 3
+}
+BURST_SECONDS = 10  # Each bucket holds this many seconds' worth of requests
+
+# chat.postMessage is limited per channel rather than by tier
+CHANNEL_POST_RATE = 1.0  # Messages per second to one channel
+CHANNEL_POST_BURST = 3
+WORKSPACE_POST_RATE = 10.0  # Messages per second across all channels
+WORKSPACE_POST_BURST = 20
+
+GATEWAY_CONCURRENCY = int(os.environ.get("SLACK_CONCURRENCY", 16))  # Requests in flight at once
+INTERACTIVE_RESERVE = 4  # In-flight slots background traffic may never take
+MAX_CHANNEL_BUCKETS = 2048  # Idle per-channel buckets beyond this are dropped
+
+# Lower lanes are served first
+LANE_INTERACTIVE = 0
+LANE_BACKGROUND = 1
+LANE_NAMES = {LANE_INTERACTIVE: "interactive", LANE_BACKGROUND: "background"}
+
+# Lane of the Slack calls made by the current task; tasks inherit it from their creator
+current_lane = contextvars.ContextVar("slack_lane", default=LANE_INTERACTIVE)
+
+async def run_in_lane(lane: int, coro):
+    """Await `coro` with its Slack calls in the given lane."""
+    token = current_lane.set(lane)
+    try:
+        return await coro
+    finally:
+        current_lane.reset(token)
+
+class TokenBucket:
+    """Token bucket whose waiters are served lane first, then in arrival order."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._waiters = []  # heap of (lane, sequence, future)
+        self._sequence = itertools.count()
+        self._drainer = None
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    @property
+    def is_idle(self) -> bool:
+        self._refill()
+        return not self._waiters and self.tokens >= self.capacity
+
+    def pause(self, seconds: float):
+        """Hand out no tokens for `seconds`, e.g. after Slack rate limited the method."""
+        self._refill()
+        self.tokens = min(self.tokens, 0) - seconds * self.rate
+
+    async def acquire(self, lane: int):
+        """Take one token, waiting behind earlier and higher-priority callers."""
+        self._refill()
+        if not self._waiters and self.tokens >= 1:
+            self.tokens -= 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (lane, next(self._sequence), future))
+        if self._drainer is None or self._drainer.done():
+            self._drainer = asyncio.create_task(self._drain())
+        await future
+
+    async def _drain(self):
+        while self._waiters:
+            future = self._waiters[0][2]
+            if future.done():
+                # The waiter was cancelled
+                heapq.heappop(self._waiters)
+                continue
+            self._refill()
+            if self.tokens >= 1:
+                heapq.heappop(self._waiters)
+                self.tokens -= 1
+                future.set_result(None)
+            else:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+class InFlightLimiter:
+    """
+    Caps concurrent requests. Interactive waiters go first, and background
+    requests leave `reserve` slots free so interactive calls never wait for
+    a pile of background requests to finish.
+    """
+
+    def __init__(self, limit: int, reserve: int):
+        self.limit = limit
+        self.reserve = reserve
+        self.in_flight = 0
+        self._waiters = []  # heap of (lane, sequence, future)
+        self._sequence = itertools.count()
+
+    def _available(self, lane: int) -> bool:
+        limit = self.limit if lane == LANE_INTERACTIVE else self.limit - self.reserve
+        return self.in_flight < limit
+
+    def waiting(self, lane: int) -> int:
+        return sum(1 for waiter_lane, _, future in self._waiters if waiter_lane == lane and not future.done())
+
+    def _queued_ahead(self, lane: int) -> bool:
+        return any(waiter_lane <= lane and not future.done() for waiter_lane, _, future in self._waiters)
+
+    async def acquire(self, lane: int):
+        # Queued background calls only wait for their own share, so they do not hold up interactive ones
+        if self._available(lane) and not self._queued_ahead(lane):
+            self.in_flight += 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (lane, next(self._sequence), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # A slot handed over just as the caller was cancelled goes back
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self):
+        self.in_flight -= 1
+        while self._waiters:
+            lane, _, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if not self._available(lane):
+                break
+            heapq.heappop(self._waiters)
+            self.in_flight += 1
+            future.set_result(None)
+
+class SlackGateway:
+    """
+    Single point every Slack Web API call passes through.
+
+    Each call takes a token from its method's rate-tier bucket (and, for
+    chat.postMessage, from per-channel and workspace buckets), then an
+    in-flight slot. Calls in the interactive lane are served ahead of the
+    background lane at every step, so modals opened during an end-of-day
+    burst do not queue behind reminder DMs. With several worker processes,
+    each gateway's buckets hold that process's share of Slack's limits.
+    """
+
+    def __init__(self, concurrency=GATEWAY_CONCURRENCY, reserve=INTERACTIVE_RESERVE, processes=1):
+        self.share = 1 / max(1, processes)
+        self._buckets = {}
+        self._channel_buckets = {}
+        self._in_flight = InFlightLimiter(concurrency, reserve)
+        self.calls = {lane: 0 for lane in LANE_NAMES}
+        self.max_wait = {lane: 0.0 for lane in LANE_NAMES}
+
+    def set_processes(self, processes: int):
+        """Keep to a 1/processes share of Slack's limits; call before any traffic."""
+        self.share = 1 / max(1, processes)
+        self._buckets.clear()
+        self._channel_buckets.clear()
+        logger.info(f"Slack gateway uses a 1/{processes} share of the rate limits")
+
+    def _bucket(self, rate: float, burst: float) -> TokenBucket:
+        return TokenBucket(rate * self.share, max(1, burst * self.share))
+
+    def _method_bucket(self, api_method: str) -> TokenBucket:
+        bucket = self._buckets.get(api_method)
+        if bucket is None:
+            if api_method == "chat.postMessage":
+                bucket = self._bucket(WORKSPACE_POST_RATE, WORKSPACE_POST_BURST)
+            else:
+                per_minute = TIER_RATES[METHOD_TIERS.get(api_method, DEFAULT_TIER)]
+                bucket = self._bucket(per_minute / 60, per_minute * BURST_SECONDS / 60)
+            self._buckets[api_method] = bucket
+        return bucket
+
+    def _channel_bucket(self, channel: str) -> TokenBucket:
+        bucket = self._channel_buckets.get(channel)
+        if bucket is None:
+            if len(self._channel_buckets) >= MAX_CHANNEL_BUCKETS:
+                for idle in [key for key, b in self._channel_buckets.items() if b.is_idle]:
+                    del self._channel_buckets[idle]
+            bucket = self._bucket(CHANNEL_POST_RATE, CHANNEL_POST_BURST)
+            self._channel_buckets[channel] = bucket
+        return bucket
+
+    async def acquire(self, api_method: str, channel: str = None, lane: int = None):
+        """Wait until a call may be sent; pair every acquire with release()."""
+        lane = current_lane.get() if lane is None else lane
+        started = time.monotonic()
+        await self._method_bucket(api_method).acquire(lane)
+        if api_method == "chat.postMessage" and channel:
+            await self._channel_bucket(channel).acquire(lane)
+        await self._in_flight.acquire(lane)
+        self.calls[lane] += 1
+        self.max_wait[lane] = max(self.max_wait[lane], time.monotonic() - started)
+
+    def release(self):
+        """Free the in-flight slot of a finished call."""
+        self._in_flight.release()
+
+    def rate_limited(self, api_method: str, seconds: float, channel: str = None):
+        """Hold back every caller of a method Slack rate limited, not just the one retrying."""
+        logger.warning(f"Slack rate limited {api_method}; pausing it for {seconds}s")
+        if api_method == "chat.postMessage" and channel:
+            self._channel_bucket(channel).pause(seconds)
+        else:
+            self._method_bucket(api_method).pause(seconds)
+
+    def metrics(self) -> dict:
+        """In-flight and waiting requests, and per-lane call counts and worst waits."""
+        return {
+            "in_flight": self._in_flight.in_flight,
+            "capacity": self._in_flight.limit,
+            "rate_share": round(self.share, 3),
+            **{
+                name: {
+                    "calls": self.calls[lane],
+                    "waiting": self._in_flight.waiting(lane),
+                    "max_wait_seconds": round(self.max_wait[lane], 3)
+                }
+                for lane, name in LANE_NAMES.items()
+            }
+        }
+
+# Shared gateway for every Slack client in the process
+slack_gateway = SlackGateway()
+
+class GatewayWebClient(AsyncWebClient):
+    """
+    AsyncWebClient whose API calls all pass through the shared gateway and
+    the per-method circuit breaker.
+    """
+
+    @classmethod
+    def wrap(cls, client: AsyncWebClient) -> "GatewayWebClient":
+        """Build a gateway client with the same token, settings and HTTP session."""
+        return cls(
+            token=client.token,
+            base_url=client.base_url,
+            timeout=client.timeout,
+            ssl=client.ssl,
+            proxy=client.proxy,
+            session=client.session,
+            trust_env_in_session=client.trust_env_in_session,
+            headers=client.headers,
+            team_id=client.default_params.get("team_id"),
+            logger=client.logger,
+            retry_handlers=client.retry_handlers
+        )
+
+    async def api_call(self, api_method: str, **kwargs):
+        payload = kwargs.get("json") or kwargs.get("params") or kwargs.get("data")
+        channel = payload.get("channel") if isinstance(payload, dict) else None
+        # Fail fast before queueing for a method whose circuit is open
+        slack_breaker.check(api_method)
+        await slack_gateway.acquire(api_method, channel)
+        try:
+            response = await super().api_call(api_method, **kwargs)
+        except Exception as e:
+            slack_breaker.record_error(api_method, e)
+            wait = retry_after(e)
+            if wait is not None:
+                slack_gateway.rate_limited(api_method, wait, channel)
+            raise
+        finally:
+            slack_gateway.release()
+        slack_breaker.record_success(api_method)
+        return response
@@ -0,0 +1,103 @@
+import os
+import time
+import logging
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+HTTP_POOL_SIZE = int(os.environ.get("HTTP_POOL_SIZE", 32))  # Connections open to Slack at once
+HTTP_KEEPALIVE = 30  # Seconds an idle connection is kept for reuse
+HTTP_DNS_TTL = 300  # Seconds a DNS lookup is cached
+HTTP_CONNECT_TIMEOUT = 5  # Seconds to establish a connection, including waiting for a pool slot
+HTTP_TIMEOUT = 30  # Seconds for a whole request, matching the Slack SDK default
+
+class HttpPool:
+    """
+    One aiohttp session and connection pool shared by every Slack client.
+
+    The session is created on first use inside the running loop. Trace hooks
+    count connections created and reused and time spent queued for a free
+    connection, so the pool can be sized for peak reminder waves.
+    """
+
+    def __init__(self, size=HTTP_POOL_SIZE):
+        self.size = size
+        self._session = None
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.created = 0
+        self.reused = 0
+        self.queued = 0
+        self.max_queue_wait = 0.0
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        trace = aiohttp.TraceConfig()
+
+        async def on_request_start(session, context, params):
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        async def on_request_done(session, context, params):
+            self.in_flight -= 1
+
+        async def on_connection_create_end(session, context, params):
+            self.created += 1
+
+        async def on_connection_reuseconn(session, context, params):
+            self.reused += 1
+
+        async def on_queued_start(session, context, params):
+            self.queued += 1
+            context.queued_at = time.monotonic()
+
+        async def on_queued_end(session, context, params):
+            self.max_queue_wait = max(self.max_queue_wait, time.monotonic() - context.queued_at)
+
+        trace.on_request_start.append(on_request_start)
+        trace.on_request_end.append(on_request_done)
+        trace.on_request_exception.append(on_request_done)
+        trace.on_connection_create_end.append(on_connection_create_end)
+        trace.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace.on_connection_queued_start.append(on_queued_start)
+        trace.on_connection_queued_end.append(on_queued_end)
+        return trace
+
+    def session(self) -> aiohttp.ClientSession:
+        """The shared session; must first be called while the event loop runs."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.size,
+                limit_per_host=self.size,
+                keepalive_timeout=HTTP_KEEPALIVE,
+                ttl_dns_cache=HTTP_DNS_TTL
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+                trace_configs=[self._trace_config()]
+            )
+            logger.info(f"Opened HTTP pool with {self.size} connections")
+        return self._session
+
+    async def close(self):
+        """Close the session and its connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    def stats(self) -> dict:
+        """Pool size and usage counters."""
+        return {
+            "size": self.size,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "requests": self.requests,
+            "connections_created": self.created,
+            "connections_reused": self.reused,
+            "queued": self.queued,
+            "max_queue_wait_seconds": round(self.max_queue_wait, 3)
+        }
+
+# Shared pool for the process
+http_pool = HttpPool()
@@ -0,0 +1,84 @@
+import time
+import logging
+from datetime import timedelta
+from app.utils.db import run_db
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_TTL = timedelta(hours=24)  # How long a processed submission is remembered
+
+def _setup(conn):
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS processed_views ("
+        " key TEXT PRIMARY KEY,"
+        " processed_at REAL NOT NULL)"
+    )
+    conn.commit()
+
+def _claim(conn, key, now, cutoff):
+    _setup(conn)
+    conn.execute("DELETE FROM processed_views WHERE processed_at < ?", (cutoff,))
+    claimed = conn.execute(
+        "INSERT OR IGNORE INTO processed_views VALUES (?, ?)", (key, now)
+    ).rowcount == 1
+    conn.commit()
+    return claimed
+
+def _release(conn, key):
+    _setup(conn)
+    conn.execute("DELETE FROM processed_views WHERE key = ?", (key,))
+    conn.commit()
+
+def view_submission_key(view: dict) -> str:
+    """Identify one submission of a view; redeliveries carry the same ID and hash."""
+    return f"{view['id']}:{view.get('hash', '')}"
+
+class IdempotencyGuard:
+    """
+    Time-bounded dedupe table for payloads Slack may deliver more than once.
+
+    Keys are checked in memory first and then claimed in SQLite, so replays
+    are recognised even after a restart, without any Slack API calls.
+    """
+
+    def __init__(self, ttl=IDEMPOTENCY_TTL):
+        self.ttl = ttl.total_seconds()
+        self._seen = {}  # key -> processed_at
+        self.replays = 0
+
+    def _prune(self, cutoff: float):
+        for key in [key for key, seen_at in self._seen.items() if seen_at < cutoff]:
+            del self._seen[key]
+
+    async def claim(self, key: str) -> bool:
+        """Return True the first time a key is seen within the TTL, False for replays."""
+        now = time.time()
+        cutoff = now - self.ttl
+        seen_at = self._seen.get(key)
+        if seen_at is not None and seen_at >= cutoff:
+            self.replays += 1
+            return False
+        self._seen[key] = now
+        if len(self._seen) % 100 == 0:
+            self._prune(cutoff)
+
+        try:
+            claimed = await run_db(_claim, key, now, cutoff)
+        except Exception as e:
+            # The in-memory table still protects this process
+            logger.error(f"Error recording processed payload {key}: {e}")
+            return True
+        if not claimed:
+            self.replays += 1
+        return claimed
+
+    async def release(self, key: str):
+        """Forget a key so a redelivery is processed again, e.g. after a failure."""
+        self._seen.pop(key, None)
+        try:
+            await run_db(_release, key)
+        except Exception as e:
+            logger.error(f"Error releasing processed payload {key}: {e}")
+
+# Shared guard for view submissions
+submission_guard = IdempotencyGuard()
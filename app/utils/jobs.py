@@ -0,0 +1,156 @@
+import os
+import time
+import asyncio
+import logging
+import itertools
+from dataclasses import dataclass, field
+from app.utils.gateway import current_lane, LANE_INTERACTIVE, LANE_BACKGROUND
+
+logger = logging.getLogger(__name__)
+
+JOB_WORKERS = int(os.environ.get("JOB_WORKERS", 8))
+JOB_QUEUE_SIZE = int(os.environ.get("JOB_QUEUE_SIZE", 500))
+JOB_RETRY_DELAY = 1  # Seconds before the first retry; doubles per attempt
+JOB_OPTIONAL_HEADROOM = 0.5  # Optional jobs are dropped once the queue is this full
+
+# Lower numbers run first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 10
+
+@dataclass
+class Job:
+    name: str
+    func: object
+    args: tuple
+    kwargs: dict
+    retries: int
+    on_failure: object = None
+    retry_if: object = None
+    attempts: int = 0
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+class JobQueue:
+    """
+    Bounded in-process queue for work done after a handler has acked.
+
+    A fixed pool of workers drains the queue in priority order, so a burst
+    of submissions waits in line instead of spawning unbounded coroutines.
+    When the queue is full, submit() waits, pushing back on the caller.
+    """
+
+    def __init__(self, workers=JOB_WORKERS, maxsize=JOB_QUEUE_SIZE, retry_delay=JOB_RETRY_DELAY):
+        self.worker_count = workers
+        self.maxsize = maxsize
+        self.retry_delay = retry_delay
+        self._queue = asyncio.PriorityQueue(maxsize)
+        self._sequence = itertools.count()
+        self._workers = []
+        self._retries = set()  # Jobs waiting out their retry delay
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.retried = 0
+        self.dropped = 0
+        self.max_depth = 0
+        self.last_wait = 0.0
+
+    def start(self):
+        """Start the worker tasks; called automatically on first submit."""
+        if self._workers:
+            return
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"job-worker-{i}")
+            for i in range(self.worker_count)
+        ]
+        logger.info(f"Started {self.worker_count} job workers (queue size {self.maxsize})")
+
+    async def submit(self, name: str, func, *args, priority: int = PRIORITY_INTERACTIVE,
+                     retries: int = 0, on_failure=None, retry_if=None, **kwargs):
+        """
+        Queue `func(*args, **kwargs)`. `on_failure(error)` is awaited if the
+        job still fails after `retries` extra attempts. With `retry_if`, only
+        errors for which `retry_if(error)` is true are retried.
+        """
+        self.start()
+        job = Job(name, func, args, kwargs, retries, on_failure, retry_if)
+        await self._enqueue(priority, job)
+        self.submitted += 1
+
+    def offer(self, name: str, func, *args, priority: int = PRIORITY_BACKGROUND, **kwargs) -> bool:
+        """
+        Queue optional work such as cache warming without waiting. It is
+        dropped once the queue is filling up, so it never takes the room that
+        submit() callers would otherwise block on. Returns whether it was queued.
+        """
+        if self._queue.qsize() >= self.maxsize * JOB_OPTIONAL_HEADROOM:
+            self.dropped += 1
+            return False
+        self.start()
+        self._queue.put_nowait((priority, next(self._sequence), Job(name, func, args, kwargs, 0)))
+        self.submitted += 1
+        self._record_depth()
+        return True
+
+    async def _enqueue(self, priority: int, job: Job):
+        await self._queue.put((priority, next(self._sequence), job))
+        self._record_depth()
+
+    def _record_depth(self):
+        depth = self._queue.qsize()
+        self.max_depth = max(self.max_depth, depth)
+        if depth >= self.maxsize * 0.8:
+            logger.warning(f"Job queue is {depth}/{self.maxsize} full")
+
+    async def _retry_later(self, priority: int, job: Job, delay: float):
+        await asyncio.sleep(delay)
+        await self._enqueue(priority, job)
+
+    async def _worker(self):
+        while True:
+            priority, _, job = await self._queue.get()
+            self.last_wait = time.monotonic() - job.enqueued_at
+            # Slack calls of background jobs yield to interactive traffic
+            lane = current_lane.set(LANE_BACKGROUND if priority >= PRIORITY_BACKGROUND else LANE_INTERACTIVE)
+            try:
+                job.attempts += 1
+                await job.func(*job.args, **job.kwargs)
+                self.completed += 1
+            except Exception as e:
+                if job.attempts <= job.retries and (job.retry_if is None or job.retry_if(e)):
+                    self.retried += 1
+                    delay = self.retry_delay * 2 ** (job.attempts - 1)
+                    logger.warning(f"Job {job.name} failed (attempt {job.attempts}), retrying in {delay}s: {e}")
+                    job.enqueued_at = time.monotonic() + delay
+                    retry = asyncio.create_task(self._retry_later(priority, job, delay))
+                    self._retries.add(retry)
+                    retry.add_done_callback(self._retries.discard)
+                else:
+                    self.failed += 1
+                    logger.error(f"Job {job.name} failed after {job.attempts} attempts: {e}")
+                    if job.on_failure is not None:
+                        try:
+                            await job.on_failure(e)
+                        except Exception as e2:
+                            logger.error(f"Error in failure handler for job {job.name}: {e2}")
+            finally:
+                current_lane.reset(lane)
+                self._queue.task_done()
+
+    def metrics(self) -> dict:
+        """Current queue depth and job counters."""
+        return {
+            "depth": self._queue.qsize(),
+            "max_depth": self.max_depth,
+            "capacity": self.maxsize,
+            "workers": len(self._workers),
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "retried": self.retried,
+            "dropped": self.dropped,
+            "waiting_retry": len(self._retries),
+            "last_wait_seconds": round(self.last_wait, 3)
+        }
+
+# Shared queue instance
+job_queue = JobQueue()
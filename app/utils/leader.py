@@ -0,0 +1,65 @@
+import os
+import logging
+from datetime import timedelta
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+SCHEDULER_LOCK_PATH = os.environ.get("SCHEDULER_LOCK_PATH", "eod_scheduler.lock")
+SCHEDULER_LOCK_RETRY = timedelta(seconds=30)  # How often standby workers try to take over
+
+class ProcessLock:
+    """
+    Exclusive lock on a file, held for the life of the process.
+
+    Worker processes race for it and exactly one wins. The operating system
+    drops the lock when the holder exits, even if it crashes, so a standby
+    worker that keeps trying takes over.
+    """
+
+    def __init__(self, path=SCHEDULER_LOCK_PATH):
+        self.path = path
+        self._file = None
+
+    @property
+    def is_held(self) -> bool:
+        return self._file is not None
+
+    def acquire(self) -> bool:
+        """Try to take the lock without waiting; True if this process holds it."""
+        if self._file is not None:
+            return True
+        if fcntl is None:
+            logger.warning("File locks are unavailable on this platform; assuming a single process")
+            self._file = True
+            return True
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        lock_file = open(self.path, "a+")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        lock_file.truncate(0)
+        lock_file.write(str(os.getpid()))
+        lock_file.flush()
+        self._file = lock_file
+        return True
+
+    def release(self):
+        """Give the lock up if this process holds it."""
+        if self._file is None:
+            return
+        if fcntl is not None:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+            self._file.close()
+        self._file = None
+
+# Lock electing the one worker that runs the reminder scheduler
+scheduler_lock = ProcessLock()
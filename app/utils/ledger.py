@@ -0,0 +1,212 @@
+import logging
+import asyncio
+from datetime import date, timedelta
+from app.utils.db import run_db
+
+logger = logging.getLogger(__name__)
+
+LEDGER_FLUSH_DELAY = 1  # Seconds to batch writes before flushing
+LEDGER_FLUSH_BATCH = 100  # Flush immediately once this many writes are pending
+LEDGER_RETENTION = timedelta(days=7)  # Keep sent-reminder records this long
+
+def _setup(conn):
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS sent_reminders ("
+        " user_id TEXT NOT NULL,"
+        " local_date TEXT NOT NULL,"
+        " PRIMARY KEY (user_id, local_date))"
+    )
+    conn.commit()
+
+def _load(conn, cutoff):
+    _setup(conn)
+    conn.execute("DELETE FROM sent_reminders WHERE local_date < ?", (cutoff,))
+    conn.commit()
+    return conn.execute("SELECT user_id, local_date FROM sent_reminders").fetchall()
+
+def _write(conn, rows, cutoff):
+    _setup(conn)
+    conn.executemany("INSERT OR IGNORE INTO sent_reminders VALUES (?, ?)", rows)
+    conn.execute("DELETE FROM sent_reminders WHERE local_date < ?", (cutoff,))
+    conn.commit()
+
+class ReminderLedger:
+    """
+    Persistent record of sent reminders keyed by (user_id, local_date).
+
+    Lookups are answered from an in-memory set; writes are batched and
+    flushed to SQLite on the database thread, so dedup checks never touch
+    the network or block the event loop.
+    """
+
+    def __init__(self, retention=LEDGER_RETENTION):
+        self.retention = retention
+        self._sent = set()
+        self._pending = []
+        self._flush_task = None
+        self._flushes = set()  # Batch flushes still writing
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._sent
+
+    def __len__(self) -> int:
+        return len(self._sent)
+
+    def _cutoff(self) -> str:
+        return (date.today() - self.retention).isoformat()
+
+    async def open(self):
+        """Load previously sent reminders from disk."""
+        try:
+            rows = await run_db(_load, self._cutoff())
+            self._sent.update(tuple(row) for row in rows)
+            logger.info(f"Loaded {len(rows)} sent reminders from the ledger")
+        except Exception as e:
+            logger.error(f"Error loading reminder ledger: {e}")
+
+    def add(self, key: tuple):
+        """Record a sent reminder; the write is flushed in the background."""
+        if key in self._sent:
+            return
+        self._sent.add(key)
+        self._pending.append(key)
+        if len(self._pending) >= LEDGER_FLUSH_BATCH:
+            flush = asyncio.create_task(self.flush())
+            self._flushes.add(flush)
+            flush.add_done_callback(self._flushes.discard)
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        await asyncio.sleep(LEDGER_FLUSH_DELAY)
+        await self.flush()
+
+    async def flush(self):
+        """Write pending records to disk."""
+        if not self._pending:
+            return
+        rows, self._pending = self._pending, []
+        try:
+            await run_db(_write, rows, self._cutoff())
+        except Exception as e:
+            logger.error(f"Error writing {len(rows)} records to reminder ledger: {e}")
+            self._pending.extend(rows)
+
+    def prune(self):
+        """Drop in-memory records older than the retention period."""
+        cutoff = self._cutoff()
+        stale = {key for key in self._sent if key[1] < cutoff}
+        self._sent.difference_update(stale)
+        return len(stale)
+
+def _setup_scheduled(conn):
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS scheduled_reminders ("
+        " user_id TEXT PRIMARY KEY,"
+        " channel_id TEXT NOT NULL,"
+        " scheduled_message_id TEXT,"
+        " post_at INTEGER NOT NULL,"
+        " user_tz TEXT NOT NULL,"
+        " local_date TEXT NOT NULL)"
+    )
+    conn.commit()
+
+def _load_scheduled(conn):
+    _setup_scheduled(conn)
+    return conn.execute(
+        "SELECT user_id, channel_id, scheduled_message_id, post_at, user_tz, local_date"
+        " FROM scheduled_reminders"
+    ).fetchall()
+
+def _save_scheduled(conn, record):
+    _setup_scheduled(conn)
+    conn.execute(
+        "INSERT OR REPLACE INTO scheduled_reminders VALUES (?, ?, ?, ?, ?, ?)",
+        (record["user_id"], record["channel_id"], record["scheduled_message_id"],
+         record["post_at"], record["user_tz"], record["local_date"])
+    )
+    conn.commit()
+
+def _delete_scheduled(conn, user_id):
+    _setup_scheduled(conn)
+    conn.execute("DELETE FROM scheduled_reminders WHERE user_id = ?", (user_id,))
+    conn.commit()
+
+class ScheduledReminders:
+    """
+    Persistent record of the latest reminder handed to chat.scheduleMessage
+    for each user, so it can be cancelled or replaced after a restart.
+    """
+
+    FIELDS = ("user_id", "channel_id", "scheduled_message_id", "post_at", "user_tz", "local_date")
+
+    def __init__(self):
+        self._by_user = {}
+
+    def __len__(self) -> int:
+        return len(self._by_user)
+
+    def __iter__(self):
+        return iter(list(self._by_user))
+
+    async def open(self):
+        """Load scheduled reminders from disk."""
+        try:
+            rows = await run_db(_load_scheduled)
+            for row in rows:
+                record = dict(zip(self.FIELDS, row))
+                self._by_user[record["user_id"]] = record
+            logger.info(f"Loaded {len(rows)} scheduled reminders")
+        except Exception as e:
+            logger.error(f"Error loading scheduled reminders: {e}")
+
+    def get(self, user_id: str) -> dict:
+        """Get the latest scheduled reminder for a user, or None."""
+        return self._by_user.get(user_id)
+
+    async def save(self, record: dict):
+        """Store the latest scheduled reminder for a user."""
+        self._by_user[record["user_id"]] = record
+        await run_db(_save_scheduled, record)
+
+    async def remove(self, user_id: str):
+        """Forget a user's scheduled reminder."""
+        if self._by_user.pop(user_id, None) is not None:
+            await run_db(_delete_scheduled, user_id)
+
+def _setup_changes(conn):
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS schedule_changes ("
+        " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+        " user_id TEXT NOT NULL,"
+        " user_tz TEXT)"
+    )
+    conn.commit()
+
+def _push_change(conn, user_id, user_tz):
+    _setup_changes(conn)
+    conn.execute("INSERT INTO schedule_changes (user_id, user_tz) VALUES (?, ?)", (user_id, user_tz))
+    conn.commit()
+
+def _take_changes(conn):
+    _setup_changes(conn)
+    rows = conn.execute("SELECT id, user_id, user_tz FROM schedule_changes ORDER BY id").fetchall()
+    if rows:
+        conn.execute("DELETE FROM schedule_changes WHERE id <= ?", (rows[-1][0],))
+        conn.commit()
+    return [(user_id, user_tz) for _, user_id, user_tz in rows]
+
+class ScheduleChanges:
+    """
+    Reminder schedule changes handed, through SQLite, from the worker process
+    that received an event to the one running the reminder scheduler. A
+    change without a timezone takes the user off the schedule.
+    """
+
+    async def push(self, user_id: str, user_tz: str = None):
+        """Queue a change for the scheduler process."""
+        await run_db(_push_change, user_id, user_tz)
+
+    async def take(self) -> list:
+        """Remove and return queued changes as (user_id, user_tz) pairs, oldest first."""
+        return await run_db(_take_changes)
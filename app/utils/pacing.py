@@ -0,0 +1,34 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
+class AdaptivePacer:
+    """
+    Track the send rate Slack is currently tolerating.
+
+    The rate creeps up after each successful send and is halved whenever
+    Slack answers with a rate limit, so the pacer settles just under the
+    observed headroom.
+    """
+
+    def __init__(self, rate=2.0, min_rate=0.2, max_rate=10.0, increase=0.1):
+        self.rate = rate  # Sends per second
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.ratelimited = 0
+
+    def next_interval(self, remaining: int, time_left: float) -> float:
+        """Seconds to wait before the next send so `remaining` sends fill `time_left`."""
+        if remaining <= 0:
+            return 0
+        spread = max(time_left, 0) / remaining
+        return max(spread, 1 / self.rate)
+
+    def on_success(self):
+        self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_ratelimit(self):
+        self.ratelimited += 1
+        self.rate = max(self.min_rate, self.rate / 2)
+        logger.warning(f"Rate limited; pacing reminders at {self.rate:.2f}/s")
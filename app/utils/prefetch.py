@@ -0,0 +1,27 @@
+import asyncio
+import logging
+from slack_sdk.web.async_client import AsyncWebClient
+from app.utils.channels import channel_catalog
+from app.utils.timezone import get_user_timezone
+from app.utils.jobs import job_queue
+
+logger = logging.getLogger(__name__)
+
+async def _warm_user_flow(client: AsyncWebClient, user_id: str):
+    results = await asyncio.gather(
+        channel_catalog.ensure_fresh(client),
+        get_user_timezone(client, user_id),
+        return_exceptions=True
+    )
+    for name, result in zip(("channels", "timezone"), results):
+        if isinstance(result, Exception):
+            logger.warning(f"Error prefetching {name} for {user_id}: {result}")
+
+def prefetch_user_flow(client: AsyncWebClient, user_id: str):
+    """
+    Warm the caches the user's next steps read from: the project channel
+    catalog and their timezone. Runs as an optional background job, skipped
+    when the job queue is busy, so the caller is never held up.
+    """
+    if not job_queue.offer("prefetch", _warm_user_flow, client, user_id):
+        logger.debug(f"Job queue is busy; skipping prefetch for {user_id}")
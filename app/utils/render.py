@@ -0,0 +1,88 @@
+import json
+import hashlib
+import logging
+from datetime import datetime
+from app.config import PRIORITIES, STATUS_MESSAGE
+from app.utils.files import build_media_block
+
+logger = logging.getLogger(__name__)
+
+# Templates compiled once from app/config.py; user text is only ever passed
+# as a format argument, never spliced into a template.
+_DIVIDER = STATUS_MESSAGE["divider"]
+_HEADER = (
+    f"{_DIVIDER}\n{STATUS_MESSAGE['header']}{{edited}}\n{_DIVIDER}\n\n"
+    f"{STATUS_MESSAGE['local_time']}\n"
+    f"{STATUS_MESSAGE['priority']}\n\n"
+    f"{_DIVIDER}\n{STATUS_MESSAGE['update']}\n{{update_text}}\n\n"
+    f"{_DIVIDER}\n{STATUS_MESSAGE['next_steps']}\n{{next_steps}}\n"
+)
+_DEV_NOTES = f"\n{_DIVIDER}\n{STATUS_MESSAGE['dev_notes']}\n{{}}\n"
+_BLOCKERS = f"\n{_DIVIDER}\n{STATUS_MESSAGE['blockers']}\n{{}}\n"
+_MEDIA = f"\n{_DIVIDER}\n{STATUS_MESSAGE['media']}\n"
+_EDITED = STATUS_MESSAGE["edited"]
+_TIME_FORMAT = STATUS_MESSAGE["time_format"]
+_DEFAULT_PRIORITY_EMOJI = PRIORITIES["medium"]
+_EDIT_BUTTON_TEXT = {"type": "plain_text", "text": STATUS_MESSAGE["edit_button"], "emoji": True}
+
+def build_edit_button(update_id: str) -> dict:
+    """Build the edit button for a posted status update."""
+    return {
+        "type": "actions",
+        "elements": [
+            {
+                "type": "button",
+                "text": _EDIT_BUTTON_TEXT,
+                "style": "primary",
+                "action_id": "edit_status_update",
+                "value": update_id
+            }
+        ]
+    }
+
+def content_hash(form_data: dict, file_ids: list) -> str:
+    """
+    Hash what a rendered update shows, for detecting no-op edits. The local
+    time and edited marker are left out since they differ on every render.
+    """
+    payload = json.dumps({"form_data": form_data, "files": list(file_ids)}, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+def render_status(user_id: str, form_data: dict, local_time: datetime, user_tz: str,
+                  files: list = (), update_id: str = None, edited: bool = False) -> tuple:
+    """
+    Render a status update as (text, blocks) for chat.postMessage/chat.update.
+    `files` are resolved file records; the edit button is added when an
+    update_id is given.
+    """
+    priority = form_data["priority"]
+    parts = [_HEADER.format(
+        user_id=user_id,
+        edited=_EDITED if edited else "",
+        local_time=local_time.strftime(_TIME_FORMAT),
+        user_tz=user_tz,
+        priority_emoji=PRIORITIES.get(priority, _DEFAULT_PRIORITY_EMOJI),
+        priority=priority.upper(),
+        update_text=form_data["update_text"],
+        next_steps=form_data["next_steps"]
+    )]
+
+    if form_data.get("technical_details"):
+        parts.append(_DEV_NOTES.format(form_data["technical_details"]))
+
+    if form_data.get("blockers") == "yes":
+        parts.append(_BLOCKERS.format(form_data.get("blockers_details") or STATUS_MESSAGE["no_blocker_details"]))
+
+    media_blocks = []
+    if files:
+        parts.append(_MEDIA)
+        for file in files:
+            parts.append(f"• {file['name']}\n")
+            media_blocks.append(build_media_block(file))
+
+    text = "".join(parts)
+    blocks = [{"type": "section", "text": {"type": "mrkdwn", "text": text}}]
+    blocks.extend(media_blocks)
+    if update_id:
+        blocks.append(build_edit_button(update_id))
+    return text, blocks
@@ -0,0 +1,148 @@
+import time
+import random
+import asyncio
+import logging
+from datetime import timedelta
+from aiohttp import ClientError
+from slack_sdk.errors import SlackApiError
+
+logger = logging.getLogger(__name__)
+
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 1.0  # Seconds; decorrelated jitter grows delays from here
+RETRY_MAX_DELAY = 30.0
+
+# Slack error codes worth another attempt; anything else is the caller's problem
+RETRYABLE_SLACK_ERRORS = {"ratelimited", "internal_error", "fatal_error", "service_unavailable", "request_timeout"}
+
+BREAKER_THRESHOLD = 5  # Consecutive failures of one method that open its circuit
+BREAKER_COOLDOWN = timedelta(seconds=30)  # How long an open circuit rejects calls
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a method whose circuit is open."""
+
+def retry_after(error: Exception) -> float:
+    """Seconds Slack asked us to wait before retrying, or None."""
+    if not isinstance(error, SlackApiError) or error.response is None:
+        return None
+    headers = error.response.headers or {}
+    value = headers.get("Retry-After")
+    if value is None:
+        value = next((v for k, v in headers.items() if k.lower() == "retry-after"), None)
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+def is_retryable(error: Exception) -> bool:
+    """Whether an error is transient: rate limits, Slack-side failures, timeouts and network errors."""
+    if isinstance(error, SlackApiError):
+        if error.response is None:
+            return False
+        return error.response.get("error") in RETRYABLE_SLACK_ERRORS or error.response.status_code >= 500
+    return isinstance(error, (ClientError, asyncio.TimeoutError, ConnectionError))
+
+class CircuitBreaker:
+    """
+    Per-method circuit breaker, applied to every call by the Slack gateway
+    client. After `threshold` consecutive transient failures a method's
+    circuit opens and calls fail fast for `cooldown`; then one trial call is
+    let through, and its outcome closes or reopens it. Rate limits do not
+    count: the gateway already waits them out.
+    """
+
+    def __init__(self, threshold=BREAKER_THRESHOLD, cooldown=BREAKER_COOLDOWN):
+        self.threshold = threshold
+        self.cooldown = cooldown.total_seconds()
+        self._failures = {}  # method -> consecutive failures
+        self._open_until = {}  # method -> monotonic time the circuit may be tried again
+        self._trials = {}  # method -> monotonic start of its trial call
+
+    def check(self, method: str):
+        """Raise CircuitOpenError if calls to `method` should not be made now."""
+        open_until = self._open_until.get(method)
+        if open_until is None:
+            return
+        now = time.monotonic()
+        trial_started = self._trials.get(method)
+        # A trial that never reported back (e.g. cancelled) stops blocking after a cooldown
+        if now < open_until or (trial_started is not None and now - trial_started < self.cooldown):
+            raise CircuitOpenError(f"Circuit for {method} is open")
+        self._trials[method] = now
+
+    def record_success(self, method: str):
+        self._failures.pop(method, None)
+        self._open_until.pop(method, None)
+        self._trials.pop(method, None)
+
+    def record_failure(self, method: str):
+        failures = self._failures.get(method, 0) + 1
+        self._failures[method] = failures
+        if failures >= self.threshold or method in self._trials:
+            self._open_until[method] = time.monotonic() + self.cooldown
+            logger.error(f"Circuit for {method} opened after {failures} consecutive failures")
+        self._trials.pop(method, None)
+
+    def record_error(self, method: str, error: Exception):
+        """Record a failed call; only transient failures count against the method."""
+        if not is_retryable(error):
+            if isinstance(error, SlackApiError):
+                self.record_success(method)  # Slack answered; the request was at fault
+            return
+        if retry_after(error) is None:
+            self.record_failure(method)
+        else:
+            self.record_success(method)  # Rate limited, but answering
+
+    def open_circuits(self) -> list:
+        """Methods whose circuit is currently open."""
+        now = time.monotonic()
+        return [method for method, until in self._open_until.items() if until > now]
+
+# Shared breaker for all Slack methods
+slack_breaker = CircuitBreaker()
+
+class RetryPolicy:
+    """
+    Retry transient failures with decorrelated jitter, so callers that fail
+    together do not retry together. A rate-limited call waits Slack's
+    Retry-After plus a jittered slice, and is reported to `on_ratelimit` if
+    given; errors that are not transient, including open circuits, are
+    raised at once.
+    """
+
+    def __init__(self, attempts=RETRY_ATTEMPTS, base_delay=RETRY_BASE_DELAY, max_delay=RETRY_MAX_DELAY,
+                 on_ratelimit=None):
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.on_ratelimit = on_ratelimit
+
+    def next_delay(self, previous: float) -> float:
+        """Decorrelated jitter: a random delay between the base and three times the previous one."""
+        return min(self.max_delay, random.uniform(self.base_delay, previous * 3))
+
+    async def call(self, func, *args, **kwargs):
+        """Await `func(*args, **kwargs)`, retrying transient failures."""
+        method = getattr(func, "__name__", repr(func))
+        delay = self.base_delay
+        for attempt in range(1, self.attempts + 1):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                if not is_retryable(e):
+                    raise
+                wait = retry_after(e)
+                if wait is not None and self.on_ratelimit is not None:
+                    self.on_ratelimit()
+                if attempt == self.attempts:
+                    raise
+                delay = self.next_delay(delay)
+                wait = delay if wait is None else wait + random.uniform(0, self.base_delay)
+                logger.warning(f"{method} failed (attempt {attempt}), retrying in {wait:.1f}s: {e}")
+                await asyncio.sleep(wait)
+
+async def retry_with_backoff(func, max_retries=RETRY_ATTEMPTS, initial_delay=RETRY_BASE_DELAY, *args, **kwargs):
+    """Call a Slack API method under the retry policy."""
+    policy = RetryPolicy(attempts=max_retries, base_delay=initial_delay)
+    return await policy.call(func, *args, **kwargs)
@@ -0,0 +1,66 @@
+import time
+import logging
+from datetime import timedelta
+from slack_sdk.web.async_client import AsyncWebClient
+
+logger = logging.getLogger(__name__)
+
+SESSION_TTL = timedelta(hours=12)  # A flow left this long starts over in a new message
+
+class ConversationSessions:
+    """
+    Per-user record of the DM message the update flow is shown in.
+
+    Each step of the flow replaces that message with chat.update instead of
+    posting a new DM. Without a live session, e.g. after a restart or when
+    the flow began in a modal, the next step is posted and becomes the session.
+    """
+
+    def __init__(self, ttl=SESSION_TTL):
+        self.ttl = ttl.total_seconds()
+        self._sessions = {}  # user_id -> {"channel_id", "message_ts", "updated_at"}
+
+    def get(self, user_id: str) -> dict:
+        """The user's live session, or None."""
+        session = self._sessions.get(user_id)
+        if session is None or time.time() - session["updated_at"] > self.ttl:
+            self._sessions.pop(user_id, None)
+            return None
+        return session
+
+    def set(self, user_id: str, channel_id: str, message_ts: str):
+        """Make a message the one the user's flow is shown in."""
+        self._sessions[user_id] = {"channel_id": channel_id, "message_ts": message_ts, "updated_at": time.time()}
+
+    def from_action(self, body: dict):
+        """Track the message an interaction came from, if it can be updated."""
+        container = body.get("container") or {}
+        if container.get("type") == "message" and not container.get("is_ephemeral"):
+            self.set(body["user"]["id"], container["channel_id"], container["message_ts"])
+
+    def end(self, user_id: str):
+        """Forget the user's session; the next flow starts in a new message."""
+        self._sessions.pop(user_id, None)
+
+    async def show(self, client: AsyncWebClient, user_id: str, text: str, blocks: list = None):
+        """Show the next step of the user's flow, in place when possible."""
+        session = self.get(user_id)
+        if session is not None:
+            try:
+                await client.chat_update(
+                    channel=session["channel_id"],
+                    ts=session["message_ts"],
+                    text=text,
+                    blocks=blocks or []  # An empty list clears the previous step's blocks
+                )
+                session["updated_at"] = time.time()
+                return
+            except Exception as e:
+                logger.warning(f"Error updating flow message for {user_id}, posting a new one: {e}")
+
+        response = await client.chat_postMessage(channel=user_id, text=text, blocks=blocks)
+        if response["ok"]:
+            self.set(user_id, response["channel"], response["ts"])
+
+# Shared session table
+conversation_sessions = ConversationSessions()
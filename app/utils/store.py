@@ -0,0 +1,87 @@
+import json
+import time
+import uuid
+import logging
+from app.utils.db import run_db
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ("update_id", "user_id", "channel_id", "message_ts", "form_data", "media_files", "created_at", "updated_at",
+          "content_hash", "media")
+JSON_FIELDS = ("form_data", "media_files", "media")
+
+# Columns added after the table was first created
+MIGRATIONS = (
+    ("content_hash", "TEXT"),
+    ("media", "TEXT NOT NULL DEFAULT '[]'")
+)
+
+def _setup(conn):
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS status_updates ("
+        " update_id TEXT PRIMARY KEY,"
+        " user_id TEXT NOT NULL,"
+        " channel_id TEXT NOT NULL,"
+        " message_ts TEXT,"
+        " form_data TEXT NOT NULL,"
+        " media_files TEXT NOT NULL,"
+        " created_at REAL NOT NULL,"
+        " updated_at REAL NOT NULL)"
+    )
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(status_updates)")}
+    for column, definition in MIGRATIONS:
+        if column not in columns:
+            conn.execute(f"ALTER TABLE status_updates ADD COLUMN {column} {definition}")
+    conn.execute("CREATE INDEX IF NOT EXISTS status_updates_user ON status_updates (user_id, created_at)")
+    conn.commit()
+
+def _to_row(update: dict) -> tuple:
+    return tuple(json.dumps(update.get(f, [])) if f in JSON_FIELDS else update.get(f) for f in FIELDS)
+
+def _from_row(row) -> dict:
+    update = dict(zip(FIELDS, row))
+    for field in JSON_FIELDS:
+        update[field] = json.loads(update[field])
+    return update
+
+def _save(conn, row):
+    _setup(conn)
+    conn.execute(f"INSERT OR REPLACE INTO status_updates VALUES ({', '.join('?' * len(FIELDS))})", row)
+    conn.commit()
+
+def _get(conn, update_id):
+    _setup(conn)
+    return conn.execute(
+        f"SELECT {', '.join(FIELDS)} FROM status_updates WHERE update_id = ?", (update_id,)
+    ).fetchone()
+
+class StatusStore:
+    """
+    Persistent store of posted status updates keyed by a generated update ID.
+
+    Edit buttons carry only the update ID; the form data, message timestamp
+    and media are loaded from here when the user edits. Each update also
+    keeps the hash of its rendered content and its resolved media, so an
+    unchanged edit needs no Slack calls.
+    """
+
+    @staticmethod
+    def new_update_id() -> str:
+        """Generate an ID for a new status update."""
+        return uuid.uuid4().hex
+
+    async def save(self, update: dict):
+        """Insert or replace a status update."""
+        now = time.time()
+        update = {"created_at": now, **update, "updated_at": now}
+        await run_db(_save, _to_row(update))
+        return update
+
+    async def get(self, update_id: str) -> dict:
+        """Load a status update by ID, or None if it is unknown."""
+        # Read through to the database every time, since another worker may have edited the update
+        row = await run_db(_get, update_id)
+        return _from_row(row) if row is not None else None
+
+# Shared store instance
+status_store = StatusStore()
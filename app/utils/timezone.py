@@ -1,10 +1,15 @@
 import logging
 import pytz
-from datetime import datetime
+from datetime import datetime, time, timedelta
 from slack_sdk.web.async_client import AsyncWebClient
+from app.utils.directory import user_directory
+from app.utils.cache import AsyncTTLCache
 
 logger = logging.getLogger(__name__)
 
+# Timezones for users missing from the directory
+_timezone_cache = AsyncTTLCache(timedelta(hours=1), max_size=512, stale_ttl=timedelta(hours=6), name="timezones")
+
 def setup_timezone():
     """Set up timezone handling for the application."""
     # Ensure UTC is available
@@ -13,19 +18,31 @@ def setup_timezone():
     logger.info("Timezone handling initialized")
 
 async def get_user_timezone(client: AsyncWebClient, user_id: str) -> str:
-    """Get a user's timezone from their Slack profile."""
+    """Get a user's timezone, answered from the in-memory user directory."""
     try:
-        user_info = await client.users_info(user=user_id)
-        if user_info["ok"]:
-            tz = user_info["user"].get("tz", "UTC")
-            logger.debug(f"Got timezone {tz} for user {user_id}")
+        await user_directory.ensure_fresh(client)
+        tz = user_directory.get_timezone(user_id)
+        if tz:
             return tz
-        logger.warning(f"Could not get timezone for user {user_id}, defaulting to UTC")
-        return "UTC"
+
+        # Users who joined since the last sweep, or any user while the first sweep
+        # is still running, are looked up individually
+        return await _timezone_cache.get(user_id, lambda: _fetch_user_timezone(client, user_id))
     except Exception as e:
         logger.error(f"Error getting timezone for user {user_id}: {e}")
         return "UTC"
 
+async def _fetch_user_timezone(client: AsyncWebClient, user_id: str) -> str:
+    """Look up a single user's timezone with users.info."""
+    user_info = await client.users_info(user=user_id)
+    if user_info["ok"]:
+        user_directory.update_user(user_info["user"])
+        tz = user_info["user"].get("tz", "UTC")
+        logger.debug(f"Got timezone {tz} for user {user_id}")
+        return tz
+    logger.warning(f"Could not get timezone for user {user_id}, defaulting to UTC")
+    return "UTC"
+
 def get_user_local_time(user_tz: str) -> datetime:
     """Get current time in user's timezone."""
     try:
@@ -37,6 +54,21 @@ def get_user_local_time(user_tz: str) -> datetime:
         logger.error(f"Error converting to timezone {user_tz}: {e}")
         return datetime.now(pytz.UTC)
 
+def get_next_reminder_time(user_tz: str, hour: int = 17, after: datetime = None) -> datetime:
+    """Get the next local `hour`:00 in the user's timezone, as a UTC datetime."""
+    try:
+        tz = pytz.timezone(user_tz)
+    except Exception as e:
+        logger.error(f"Error converting to timezone {user_tz}: {e}")
+        tz = pytz.UTC
+
+    after = after or datetime.now(pytz.UTC)
+    local_after = after.astimezone(tz)
+    target = tz.localize(datetime.combine(local_after.date(), time(hour)))
+    if target <= local_after:
+        target = tz.localize(datetime.combine(local_after.date() + timedelta(days=1), time(hour)))
+    return target.astimezone(pytz.UTC)
+
 def format_time_for_display(dt: datetime, include_timezone: bool = True) -> str:
     """Format a datetime object for display in messages."""
     try:
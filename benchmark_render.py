@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for status message rendering.
+Run this to check render time and payload size against their budgets;
+exits non-zero if either is exceeded.
+"""
+
+import os
+import sys
+import json
+import timeit
+from datetime import datetime
+
+# The config module refuses to load without tokens; rendering never uses them
+os.environ.setdefault("SLACK_BOT_TOKEN", "xoxb-benchmark")
+os.environ.setdefault("APP_LEVEL_TOKEN", "xapp-benchmark")
+
+from app.utils.render import render_status
+
+RENDER_BUDGET_US = 50  # Per render, in microseconds
+PAYLOAD_BUDGET_BYTES = 8000  # Serialized text + blocks for the full sample
+ITERATIONS = 20000
+
+SAMPLE_FORM = {
+    "priority": "high",
+    "update_text": "Shipped the reminder planner and moved edits onto the status store. " * 4,
+    "next_steps": "Roll out scheduled delivery to the remaining timezones. " * 2,
+    "technical_details": "Planner cancels and re-plans on user_change events.",
+    "blockers": "yes",
+    "blockers_details": "Waiting on the workspace admin to approve the new scopes."
+}
+SAMPLE_FILES = [
+    {"id": f"F{i:04d}", "name": f"screenshot-{i}.png", "filetype": "png",
+     "url_private": f"https://files.slack.com/files-pri/T0/F{i:04d}/screenshot-{i}.png"}
+    for i in range(3)
+] + [
+    {"id": "F9999", "name": "notes.pdf", "filetype": "pdf",
+     "url_private": "https://files.slack.com/files-pri/T0/F9999/notes.pdf"}
+]
+SAMPLE_TIME = datetime(2024, 1, 1, 17, 0)
+
+def render():
+    return render_status("U0000000", SAMPLE_FORM, SAMPLE_TIME, "America/New_York",
+                         SAMPLE_FILES, "0" * 32, edited=True)
+
+def main():
+    print("⏱️ Benchmarking status message rendering")
+    print("=" * 50)
+
+    best = min(timeit.repeat(render, number=ITERATIONS, repeat=5)) / ITERATIONS
+    render_us = best * 1e6
+    text, blocks = render()
+    payload_bytes = len(json.dumps({"text": text, "blocks": blocks}, ensure_ascii=False).encode())
+
+    print(f"🕒 Render time: {render_us:.1f}µs (budget {RENDER_BUDGET_US}µs)")
+    print(f"📦 Payload size: {payload_bytes} bytes (budget {PAYLOAD_BUDGET_BYTES} bytes)")
+    print(f"🧱 Blocks: {len(blocks)}")
+
+    failed = False
+    if render_us > RENDER_BUDGET_US:
+        print("❌ Render time over budget")
+        failed = True
+    if payload_bytes > PAYLOAD_BUDGET_BYTES:
+        print("❌ Payload size over budget")
+        failed = True
+    if not failed:
+        print("✅ Within budget")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
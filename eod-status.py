@@ -10,6 +10,7 @@ import logging
 import aioschedule
 from typing import Dict, List
 import json
+from app.utils.channels import channel_catalog
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -290,45 +291,13 @@ async def get_user_timezone(user_id: str) -> str:
 async def get_relevant_project_channels():
     """
     Fetch relevant project channels that the user can post to.
-    Currently returns all public channels the bot is a member of.
+    Returns the project channels the bot is a member of, using the shared
+    channel catalog so membership comes from one paginated conversations.list
+    sweep instead of a conversations.members call per channel.
     """
     try:
-        # First get all channels the bot is in
-        logger.info("Fetching channels...")
-        channels_response = await client.conversations_list(
-            types="public_channel",
-            exclude_archived=True,
-            limit=1000
-        )
-        
-        logger.info(f"Channels response: {channels_response}")
-        
-        if not channels_response or not channels_response["ok"]:
-            logger.error(f"Error fetching channels: {channels_response.get('error')}")
-            return []
-
-        # Get all channels first
-        all_channels = channels_response["channels"]
-        logger.info(f"Total channels found: {len(all_channels)}")
-        
-        # Get bot's user ID
-        auth_response = await client.auth_test()
-        bot_user_id = auth_response["user_id"]
-        logger.info(f"Bot user ID: {bot_user_id}")
-        
-        # Get channels the bot is a member of
-        bot_channels = []
-        for channel in all_channels:
-            try:
-                # Check if bot is a member
-                members_response = await client.conversations_members(channel=channel["id"])
-                if members_response["ok"] and bot_user_id in members_response["members"]:
-                    bot_channels.append(channel)
-                    logger.info(f"Bot is a member of channel: {channel['name']}")
-            except Exception as e:
-                logger.error(f"Error checking membership for channel {channel['name']}: {e}")
-                continue
-
+        await channel_catalog.ensure_fresh(client)
+        bot_channels = channel_catalog.member_channels()
         logger.info(f"Channels bot is a member of: {len(bot_channels)}")
         return bot_channels
 
@@ -849,38 +818,13 @@ async def schedule_reminders():
             await asyncio.sleep(1)  # Still sleep to prevent tight loop on error
 
 async def main():
-    # Set up the app to listen on the specified port
-    port = int(os.environ.get("PORT", 3000))
-    
-    # Initialize Socket Mode handler
-    handler = AsyncSocketModeHandler(app, os.environ.get("APP_LEVEL_TOKEN"))
-    
-    # Start the app in Socket Mode
-    await handler.start_async()
-    
+    """Legacy single-file entry point; runs in Socket Mode. Use main.py, which also offers HTTP mode."""
     # Start the reminder scheduler in the background
     asyncio.create_task(schedule_reminders())
     
-    # Also start the HTTP server for slash commands and interactivity
-    from slack_bolt.adapter.asgi import SlackRequestHandler
-    from asgiref.wsgi import WsgiToAsgi
-    from flask import Flask, request
-    
-    flask_app = Flask(__name__)
-    slack_handler = SlackRequestHandler(app)
-    
-    @flask_app.route("/slack/events", methods=["POST"])
-    async def slack_events():
-        return await slack_handler.handle(request)
-    
-    # Start Flask in a separate thread
-    from hypercorn.asyncio import serve
-    from hypercorn.config import Config
-    
-    config = Config()
-    config.bind = [f"0.0.0.0:{port}"]
-    
-    await serve(flask_app, config)
+    # Start the app in Socket Mode
+    handler = AsyncSocketModeHandler(app, os.environ.get("APP_LEVEL_TOKEN"))
+    await handler.start_async()
 
 if __name__ == "__main__":
     # Environment variables are now loaded from .env file
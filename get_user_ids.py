@@ -9,6 +9,7 @@ import asyncio
 from dotenv import load_dotenv
 from slack_sdk.web.async_client import AsyncWebClient
 from slack_sdk.errors import SlackApiError
+from app.utils.pagination import CursorPaginator
 
 # Load environment variables
 load_dotenv()
@@ -24,10 +25,10 @@ async def get_all_users():
     
     try:
         print("🔍 Fetching all users from Slack workspace...")
-        response = await client.users_list()
+        # users.list is paginated; walk every page rather than stopping at the first
+        users = await CursorPaginator(client.users_list, "members").collect()
         
-        if response["ok"]:
-            users = response["users"]
+        if users:
             print(f"✅ Found {len(users)} users in workspace")
             print("\n👥 All Users:")
             print("-" * 60)
@@ -56,7 +57,7 @@ async def get_all_users():
             print("   FALLBACK_DEVELOPER_IDS=U1234567890,U0987654321,U1122334455")
             
         else:
-            print(f"❌ Error fetching users: {response.get('error')}")
+            print("❌ No users returned from Slack")
             
     except SlackApiError as e:
         print(f"❌ Slack API error: {e.response['error']}")
@@ -1,7 +1,10 @@
 import asyncio
 import logging
 from app.bot import create_app, start_app
+from app.config import SLACK_MODE, PORT, WEB_WORKERS
 from app.handlers.reminders import start_reminder_scheduler
+from app.utils.channels import channel_catalog
+from app.utils.directory import user_directory
 from app.utils.timezone import setup_timezone
 
 # Set up logging
@@ -12,7 +15,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 async def main():
-    """Main entry point for the application."""
+    """Main entry point for the application in Socket Mode."""
     try:
         # Set up timezone handling
         setup_timezone()
@@ -20,6 +23,10 @@ async def main():
         # Create and start the app
         app = create_app()
         
+        # Load project channels and user timezones before the first request asks for them
+        channel_catalog.warm(app._client)
+        user_directory.warm(app._client)
+        
         # Start the reminder scheduler in the background
         asyncio.create_task(start_reminder_scheduler(app))
         
@@ -30,5 +37,15 @@ async def main():
         logger.error(f"Error in main: {e}")
         raise
 
+def serve_http():
+    """Serve the Events API over HTTP with several worker processes."""
+    import uvicorn
+
+    logger.info(f"Starting HTTP mode on port {PORT} with {WEB_WORKERS} workers")
+    uvicorn.run("app.server:api", host="0.0.0.0", port=PORT, workers=WEB_WORKERS, lifespan="on")
+
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    if SLACK_MODE == "http":
+        serve_http()
+    else:
+        asyncio.run(main())
@@ -0,0 +1,9 @@
+import os
+import tempfile
+
+# Configuration is validated at import, and the SQLite file must not be the real one
+os.environ.setdefault("SLACK_BOT_TOKEN", "xoxb-test")
+os.environ.setdefault("APP_LEVEL_TOKEN", "xapp-test")
+os.environ.setdefault("FALLBACK_DEVELOPER_IDS", "U1")
+os.environ["DATABASE_PATH"] = os.path.join(tempfile.mkdtemp(), "eod_status_test.db")
+os.environ["SCHEDULER_LOCK_PATH"] = os.path.join(tempfile.mkdtemp(), "eod_scheduler_test.lock")
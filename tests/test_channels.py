@@ -0,0 +1,33 @@
+import asyncio
+from app.utils.channels import ChannelCatalog
+
+class PagedClient:
+    """conversations.list whose second page waits until released."""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+
+    async def conversations_list(self, limit=None, cursor=None, **kwargs):
+        if cursor is None:
+            channels = [{"id": "C1", "name": "proj-alpha", "is_member": True}]
+            return {"ok": True, "channels": channels, "response_metadata": {"next_cursor": "2"}}
+        await self.release.wait()
+        channels = [{"id": "C2", "name": "proj-beta", "is_member": False}]
+        return {"ok": True, "channels": channels, "response_metadata": {}}
+
+def test_warm_catalog_answers_from_loaded_pages():
+    async def scenario():
+        client = PagedClient()
+        catalog = ChannelCatalog()
+        catalog.warm(client)
+        await asyncio.sleep(0.01)
+        # The first page is searchable before the sweep finishes
+        assert [c["id"] for c in catalog.search("proj")] == ["C1"]
+        assert not catalog.is_loaded
+
+        client.release.set()
+        await catalog._refresh_task
+        assert [c["id"] for c in catalog.search("proj")] == ["C1", "C2"]
+        assert catalog.is_loaded
+
+    asyncio.run(scenario())
@@ -0,0 +1,57 @@
+import asyncio
+from datetime import datetime, timedelta
+from app.utils.directory import UserDirectory
+
+class SlowClient:
+    """users.list that never answers until released."""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+        self.calls = 0
+
+    async def users_list(self, limit=None, cursor=None):
+        self.calls += 1
+        await self.release.wait()
+        return {"ok": True, "members": [{"id": "U1", "tz": "Europe/Paris"}], "response_metadata": {}}
+
+def test_stale_directory_is_served_while_refreshing():
+    async def scenario():
+        client = SlowClient()
+        directory = UserDirectory()
+        directory.update_user({"id": "U1", "tz": "America/New_York"})
+        directory._loaded = True
+        directory._expires_at = datetime.now() - timedelta(seconds=1)
+
+        await asyncio.wait_for(directory.ensure_fresh(client), timeout=1)
+        assert directory.get_timezone("U1") == "America/New_York"
+
+        client.release.set()
+        await directory._refresh_task
+        assert client.calls == 1
+        assert directory.get_timezone("U1") == "Europe/Paris"
+
+    asyncio.run(scenario())
+
+class InfoClient(SlowClient):
+    """SlowClient that also answers users.info straight away."""
+
+    async def users_info(self, user=None):
+        return {"ok": True, "user": {"id": user, "tz": "Asia/Tokyo"}}
+
+def test_lookups_do_not_wait_for_first_sweep(monkeypatch):
+    from app.utils import timezone
+
+    async def scenario():
+        client = InfoClient()
+        directory = UserDirectory()
+        monkeypatch.setattr(timezone, "user_directory", directory)
+
+        tz = await asyncio.wait_for(timezone.get_user_timezone(client, "U2"), timeout=1)
+        assert tz == "Asia/Tokyo"
+        assert not directory.is_loaded
+
+        client.release.set()
+        await directory._refresh_task
+        assert directory.is_loaded
+
+    asyncio.run(scenario())
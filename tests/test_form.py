@@ -0,0 +1,54 @@
+import json
+from app.utils.form import build_status_modal, rebuild_status_modal
+
+def _option(channel_id):
+    return {"text": {"type": "plain_text", "text": channel_id}, "value": channel_id}
+
+def _fields(suffix, update_text, files=None):
+    values = {
+        f"update_block{suffix}": {"update_text": {"value": update_text}},
+        f"next_steps_block{suffix}": {"next_steps_text": {"value": "ship it"}},
+        f"priority_block{suffix}": {"priority_select": {"selected_option": {"value": "high"}}},
+        f"technical_details_block{suffix}": {"technical_details_text": {"value": None}},
+        f"blockers_block{suffix}": {"blockers_select": {"selected_option": None}},
+        f"blockers_details_block{suffix}": {"blockers_details_text": {"value": None}}
+    }
+    if files is not None:
+        values["media_block"] = {"media_upload": {"files": files}}
+    return values
+
+def _initial_values(modal, block_id):
+    block = next(block for block in modal["blocks"] if block.get("block_id") == block_id)
+    return block["element"]
+
+def _context_text(modal):
+    return " ".join(
+        element["text"] for block in modal["blocks"] if block["type"] == "context"
+        for element in block["elements"]
+    )
+
+def test_switching_to_batch_keeps_typed_update_and_reports_dropped_media():
+    view = build_status_modal(selected_channels=[_option("C1")])
+    view["state"] = {"values": _fields("", "fixed the login bug", files=[{"id": "F1"}])}
+
+    modal = rebuild_status_modal(view, [_option("C1"), _option("C2")])
+
+    assert modal["callback_id"] == "status_submission_batch"
+    assert _initial_values(modal, "update_block_C1")["initial_value"] == "fixed the login bug"
+    assert _initial_values(modal, "priority_block_C1")["initial_option"]["value"] == "high"
+    assert _initial_values(modal, "update_block_C2")["initial_value"] == ""
+    assert "files you attached were removed" in _context_text(modal)
+
+def test_switching_back_to_single_keeps_remaining_channel_draft():
+    view = rebuild_status_modal(
+        {"callback_id": "status_submission", "state": {"values": _fields("", None)}},
+        [_option("C1"), _option("C2")]
+    )
+    view["state"] = {"values": {**_fields("_C1", "alpha"), **_fields("_C2", "beta")}}
+
+    modal = rebuild_status_modal(view, [_option("C2")])
+
+    assert modal["callback_id"] == "status_submission"
+    assert json.loads(modal["private_metadata"])["channel_id"] is None
+    assert _initial_values(modal, "update_block")["initial_value"] == "beta"
+    assert "files you attached" not in _context_text(modal)
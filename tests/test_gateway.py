@@ -0,0 +1,63 @@
+import asyncio
+import pytest
+from aiohttp import ClientConnectionError
+from slack_sdk.web.async_client import AsyncWebClient
+from app.utils import gateway
+from app.utils.gateway import GatewayWebClient
+from app.utils.retry import CircuitBreaker, CircuitOpenError
+
+def test_breaker_covers_direct_client_calls(monkeypatch):
+    calls = []
+
+    async def failing_api_call(self, api_method, **kwargs):
+        calls.append(api_method)
+        raise ClientConnectionError("connection reset")
+
+    breaker = CircuitBreaker(threshold=2)
+    monkeypatch.setattr(gateway, "slack_breaker", breaker)
+    monkeypatch.setattr(AsyncWebClient, "api_call", failing_api_call)
+
+    async def scenario():
+        client = GatewayWebClient(token="xoxb-test")
+        for _ in range(2):
+            with pytest.raises(ClientConnectionError):
+                await client.chat_update(channel="C1", ts="1.0", text="edited")
+        # The circuit is open, so the next call fails fast without reaching Slack
+        with pytest.raises(CircuitOpenError):
+            await client.chat_update(channel="C1", ts="1.0", text="edited")
+        # Other methods are unaffected
+        with pytest.raises(ClientConnectionError):
+            await client.views_open(trigger_id="T1", view={})
+
+    asyncio.run(scenario())
+    assert calls == ["chat.update", "chat.update", "views.open"]
+    assert breaker.open_circuits() == ["chat.update"]
+
+def test_workers_split_the_rate_limits():
+    slack = gateway.SlackGateway()
+    full = slack._method_bucket("users.list")
+    slack.set_processes(4)
+    share = slack._method_bucket("users.list")
+    assert share.rate == full.rate / 4
+    assert slack._channel_bucket("C1").rate == gateway.CHANNEL_POST_RATE / 4
+
+def test_interactive_call_skips_queued_background_calls():
+    limiter = gateway.InFlightLimiter(limit=16, reserve=4)
+
+    async def scenario():
+        for _ in range(12):
+            await limiter.acquire(gateway.LANE_BACKGROUND)
+        background = asyncio.create_task(limiter.acquire(gateway.LANE_BACKGROUND))
+        await asyncio.sleep(0)
+        assert limiter.waiting(gateway.LANE_BACKGROUND) == 1
+
+        await asyncio.wait_for(limiter.acquire(gateway.LANE_INTERACTIVE), timeout=0.1)
+        assert limiter.in_flight == 13
+        assert not background.done()
+
+        limiter.release()
+        limiter.release()
+        await background
+        assert limiter.in_flight == 12
+
+    asyncio.run(scenario())
@@ -0,0 +1,25 @@
+import asyncio
+from app.utils.jobs import JobQueue
+
+def test_optional_jobs_are_dropped_when_queue_is_busy():
+    async def scenario():
+        release = asyncio.Event()
+
+        async def blocked():
+            await release.wait()
+
+        queue = JobQueue(workers=1, maxsize=4)
+        for _ in range(2):
+            await queue.submit("submission", blocked)
+        await asyncio.sleep(0)
+        # One submission is running and one waits: below half full, so prefetch is queued
+        assert queue.offer("prefetch", blocked)
+        # Now half full, so further prefetch is dropped instead of waiting for room
+        assert not queue.offer("prefetch", blocked)
+        release.set()
+        await queue._queue.join()
+        return queue.metrics()
+
+    metrics = asyncio.run(scenario())
+    assert metrics["dropped"] == 1
+    assert metrics["completed"] == 3
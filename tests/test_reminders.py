@@ -0,0 +1,172 @@
+import asyncio
+from datetime import datetime, timedelta
+import pytz
+from app.handlers import reminders
+from app.handlers.reminders import ReminderScheduler, SCHEDULER_REFRESH_INTERVAL
+
+def run(coro):
+    return asyncio.run(coro)
+
+def test_scheduler_keeps_schedule_when_developer_fetch_fails(monkeypatch):
+    async def failing_fetch(client, strict=False):
+        raise LookupError("usergroup unavailable")
+
+    async def scenario():
+        scheduler = ReminderScheduler(client=None)
+        scheduler.schedule("U1", "UTC")
+        monkeypatch.setattr(reminders, "get_developer_user_ids", failing_fetch)
+        before = datetime.now(pytz.UTC)
+        await scheduler.refresh()
+        return scheduler, before
+
+    scheduler, before = run(scenario())
+    assert "U1" in scheduler._scheduled
+    # Retried well before the regular refresh
+    assert scheduler._next_refresh < before + SCHEDULER_REFRESH_INTERVAL
+
+def test_scheduler_unschedules_removed_developers(monkeypatch):
+    async def fetch(client, strict=False):
+        return ["U2"]
+
+    async def timezone(client, user_id):
+        return "UTC"
+
+    async def scenario():
+        scheduler = ReminderScheduler(client=None)
+        scheduler.schedule("U1", "UTC")
+        monkeypatch.setattr(reminders, "get_developer_user_ids", fetch)
+        monkeypatch.setattr(reminders, "get_user_timezone", timezone)
+        await scheduler.refresh()
+        return scheduler
+
+    scheduler = run(scenario())
+    assert set(scheduler._scheduled) == {"U2"}
+
+class PlannerClient:
+    """Records the scheduling calls the planner makes."""
+
+    def __init__(self):
+        self.deleted = []
+        self.scheduled = []
+
+    async def conversations_open(self, users):
+        return {"ok": True, "channel": {"id": "D1"}}
+
+    async def chat_scheduleMessage(self, channel, post_at, **kwargs):
+        self.scheduled.append(post_at)
+        return {"ok": True, "scheduled_message_id": f"Q{len(self.scheduled) + 1}"}
+
+    async def chat_deleteScheduledMessage(self, channel, scheduled_message_id):
+        self.deleted.append(scheduled_message_id)
+        return {"ok": True}
+
+def _tomorrow_at(hour):
+    """A fixed hour tomorrow, so cancellation sees the pending reminder as in the future."""
+    tomorrow = datetime.now(pytz.UTC).date() + timedelta(days=1)
+    return datetime(tomorrow.year, tomorrow.month, tomorrow.day, hour, tzinfo=pytz.UTC)
+
+def _pending(user_id, post_at, user_tz):
+    return {
+        "user_id": user_id, "channel_id": "D1", "scheduled_message_id": "Q1",
+        "post_at": int(post_at.timestamp()), "user_tz": user_tz, "local_date": post_at.date().isoformat()
+    }
+
+def test_planner_keeps_reminder_about_to_be_delivered():
+    async def scenario():
+        client = PlannerClient()
+        post_at = _tomorrow_at(17)
+        await reminders.scheduled_reminders.save(_pending("UP1", post_at, "UTC"))
+        planner = reminders.ReminderPlanner(client)
+        # Within SCHEDULE_MIN_LEAD of delivery the next slot computed is the day after
+        await planner.plan_user("UP1", "UTC", now=post_at - timedelta(minutes=1))
+        return client
+
+    client = run(scenario())
+    assert client.deleted == []
+    assert client.scheduled == []
+    assert reminders.scheduled_reminders.get("UP1")["scheduled_message_id"] == "Q1"
+
+def test_planner_replaces_reminder_after_timezone_change():
+    async def scenario():
+        client = PlannerClient()
+        post_at = _tomorrow_at(17)
+        await reminders.scheduled_reminders.save(_pending("UP2", post_at, "UTC"))
+        planner = reminders.ReminderPlanner(client)
+        await planner.plan_user("UP2", "Asia/Tokyo", now=post_at - timedelta(hours=5))
+        return client, post_at
+
+    client, post_at = run(scenario())
+    assert client.deleted == ["Q1"]
+    # 17:00 in Tokyo is 08:00 UTC the next morning
+    assert client.scheduled == [int((post_at + timedelta(hours=15)).timestamp())]
+
+def test_planner_keeps_reminders_when_developer_fetch_fails(monkeypatch):
+    async def failing_fetch(client, strict=False):
+        raise LookupError("usergroup unavailable")
+
+    async def scenario():
+        client = PlannerClient()
+        post_at = datetime.now(pytz.UTC) + timedelta(hours=1)
+        await reminders.scheduled_reminders.save(_pending("UP3", post_at, "UTC"))
+        monkeypatch.setattr(reminders, "get_developer_user_ids", failing_fetch)
+        try:
+            await reminders.ReminderPlanner(client).plan()
+        except LookupError:
+            pass
+        return client
+
+    client = run(scenario())
+    assert client.deleted == []
+    assert reminders.scheduled_reminders.get("UP3") is not None
+
+def test_schedule_changes_reach_the_scheduler_process():
+    class App:
+        """A bolt app as far as the reminder helpers are concerned."""
+
+    async def scenario():
+        worker, leader = App(), App()
+        leader._reminder_scheduler = ReminderScheduler(client=None)
+        leader._reminder_scheduler.schedule("UF2", "UTC")
+
+        # A worker without the scheduler forwards what its events tell it
+        await reminders.reschedule_user(worker, "UF1", "Asia/Tokyo")
+        await reminders.unschedule_user(worker, "UF2")
+        assert not hasattr(worker, "_reminder_scheduler")
+
+        applied = await reminders.apply_schedule_changes(leader)
+        return leader._reminder_scheduler, applied
+
+    scheduler, applied = run(scenario())
+    assert applied == 2
+    assert scheduler._scheduled["UF1"][1] == "Asia/Tokyo"
+    assert "UF2" not in scheduler._scheduled
+    # The scheduler process's own directory agrees, so its next refresh keeps the new timezone
+    assert reminders.user_directory.get_timezone("UF1") == "Asia/Tokyo"
+
+def test_socket_mode_applies_queued_changes_once_without_polling(monkeypatch):
+    class App:
+        _client = None
+
+    class StoppedScheduler(ReminderScheduler):
+        async def run(self):
+            return None
+
+    polled = []
+
+    async def poll(app):
+        polled.append(app)
+
+    monkeypatch.setattr(reminders, "REMINDER_DELIVERY", "post")
+    monkeypatch.setattr(reminders, "ReminderScheduler", StoppedScheduler)
+    monkeypatch.setattr(reminders, "poll_schedule_changes", poll)
+
+    async def scenario():
+        app = App()
+        # Queued while no process was running the scheduler
+        await reminders.schedule_changes.push("UF3", "Europe/Berlin")
+        await reminders.start_reminder_scheduler(app)
+        return app._reminder_scheduler
+
+    scheduler = run(scenario())
+    assert polled == []
+    assert scheduler._scheduled["UF3"][1] == "Europe/Berlin"
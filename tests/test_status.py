@@ -0,0 +1,80 @@
+import asyncio
+from app.handlers import status
+from app.handlers.status import queue_submission
+from app.utils.jobs import JobQueue
+from app.utils.idempotency import submission_guard
+
+class EphemeralClient:
+    def __init__(self):
+        self.ephemerals = []
+
+    async def chat_postEphemeral(self, channel, user, text):
+        self.ephemerals.append(text)
+
+def _submission(view_id):
+    body = {"user": {"id": "U1"}}
+    view = {"id": view_id, "hash": "h1", "state": {"values": {}}}
+    return body, view
+
+def test_replayed_submission_is_processed_once(monkeypatch):
+    calls = []
+
+    async def process(body, view, client):
+        calls.append(view["id"])
+
+    async def scenario():
+        # Workers belong to the loop they start in, so each test gets its own queue
+        queue = JobQueue(workers=1)
+        monkeypatch.setattr(status, "job_queue", queue)
+        body, view = _submission("V_REPLAY")
+        client = EphemeralClient()
+        await queue_submission("test_submission", process, body, view, client, error_text="failed")
+        await queue_submission("test_submission", process, body, view, client, error_text="failed")
+        await queue._queue.join()
+
+    asyncio.run(scenario())
+    assert calls == ["V_REPLAY"]
+
+def test_failed_submission_releases_claim_and_tells_user(monkeypatch):
+    async def process(body, view, client):
+        raise ValueError("bad form")
+
+    async def scenario():
+        # Workers belong to the loop they start in, so each test gets its own queue
+        queue = JobQueue(workers=1)
+        monkeypatch.setattr(status, "job_queue", queue)
+        body, view = _submission("V_FAIL")
+        client = EphemeralClient()
+        await queue_submission("test_submission", process, body, view, client, error_text="failed")
+        await queue._queue.join()
+        # The claim was released, so a redelivery is processed again
+        return client, await submission_guard.claim("V_FAIL:h1")
+
+    client, claimed_again = asyncio.run(scenario())
+    assert client.ephemerals == ["failed"]
+    assert claimed_again
+
+def test_picker_opens_before_catalog_loads(monkeypatch):
+    from app.utils.channels import ChannelCatalog
+
+    class EmptyClient:
+        def __init__(self):
+            self.release = asyncio.Event()
+
+        async def conversations_list(self, limit=None, cursor=None, **kwargs):
+            await self.release.wait()
+            return {"ok": True, "channels": [], "response_metadata": {}}
+
+    async def scenario():
+        catalog = ChannelCatalog()
+        monkeypatch.setattr(status, "channel_catalog", catalog)
+        client = EmptyClient()
+        # Nothing is loaded yet, but the picker searches as the user types
+        assert status.has_project_channels(client)
+        assert catalog._refresh_task is not None
+
+        client.release.set()
+        await catalog._refresh_task
+        assert not status.has_project_channels(client)
+
+    asyncio.run(scenario())